@@ -0,0 +1,147 @@
+'''
+
+Tracks peak memory while extracting a fixed number of marketwatch sized pages, by replaying a
+synthetic session through the price and financial statement functions. Peak memory depends on
+how many pages are parsed at once, so it's reported at the concurrency used, both when only the
+needed sections are parsed and for a full parse of every page as the baseline.
+
+Usage:
+    python benchmarks/memory.py [--pages 1000] [--concurrency 200]
+
+'''
+
+
+from threading import Thread
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from liveinvestmentdata import liveinvestmentdata
+
+
+def _filler(size: int) -> str:
+    '''
+    Page markup the extractors don't care about, roughly the given number of bytes
+    '''
+    block = '<div class="article"><a href="/story">Unrelated headline</a><p>' + 'lorem ipsum ' * 20 + '</p></div>\n'
+    return block * (size // len(block))
+
+
+def _statement_page() -> str:
+    rows = ''.join(f'<tr class="table__row{" is-highlighted" if i % 5 == 0 else ""}">'
+                   f'<td>\n\nMetric {i}\nMetric {i}\n\n</td>'
+                   + ''.join(f'<td>\n{i}.{q}B\n</td>' for q in range(5))
+                   + '</tr>'
+                   for i in range(60))
+
+    return (f'<html><body>{_filler(250_000)}'
+            f'<div class="element__body"><table>{rows}</table></div>'
+            f'{_filler(100_000)}</body></html>')
+
+
+def _quote_page() -> str:
+    return (f'<html><body>{_filler(300_000)}'
+            f'<div class="intraday__data"><h2>$137.60</h2></div>'
+            f'{_filler(100_000)}</body></html>')
+
+
+def _write_session(directory: str, pages: dict) -> None:
+    '''
+    Writes a replayable session, in the layout 'record_session' produces
+    '''
+    objects = {}
+    with open(os.path.join(directory, 'session.ndjson'), 'w') as session:
+        for url, content in pages.items():
+            content = content.encode()
+            digest = hashlib.sha256(content).hexdigest()
+            if digest not in objects:
+                path = os.path.join(directory, 'objects', digest[:2], f'{digest}.gz')
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with gzip.open(path, 'wb') as file:
+                    file.write(content)
+                objects[digest] = path
+            session.write(json.dumps({'url': url, 'sha256': digest, 'status': 200, 'start': 0, 'elapsed': 0}) + '\n')
+
+
+def _measure(name: str, pages: int, run) -> float:
+    tracemalloc.start()
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'{name:<24} {pages:>6} pages  {elapsed:7.2f}s  peak {peak / 2**20:8.1f} MiB')
+    return peak
+
+
+def _full_parse(download_url):
+    '''
+    Wraps download_url to ignore parse_only, which is how pages were parsed before sections were used
+    '''
+    def download(url, parse_only=None):
+        return download_url(url)
+
+    return download
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=1000, help='pages extracted by each run, default is 1000')
+    parser.add_argument('--concurrency', type=int, default=200, help='pages parsed at once, default is 200')
+    args = parser.parse_args()
+
+    #Every run extracts exactly --pages pages, three statement pages per financials ticker
+    tickers = [f't{i}' for i in range(args.pages)]
+    statement_pages = [(ticker, table) for ticker in tickers for table in ('income', 'balance-sheet', 'cash-flow')]
+    statement_pages = statement_pages[:args.pages]
+
+    quote, statement = _quote_page(), _statement_page()
+    pages = {f'https://www.marketwatch.com/investing/stock/{ticker}': quote for ticker in tickers}
+    for ticker, table in statement_pages:
+        pages[f'https://www.marketwatch.com/investing/stock/{ticker}/financials/{table}/quarter'] = statement
+
+    statements = {'income': liveinvestmentdata.marketwatch_income_statement,
+                  'balance-sheet': liveinvestmentdata.marketwatch_balance_sheet,
+                  'cash-flow': liveinvestmentdata.marketwatch_cash_flow,
+                 }
+
+    def prices():
+        for start in range(0, len(tickers), args.concurrency):
+            liveinvestmentdata.multiple_stock_prices(tickers[start:start + args.concurrency])
+
+    def financials():
+        for start in range(0, len(statement_pages), args.concurrency):
+            threads = [Thread(target=statements[table], args=(ticker,))
+                       for ticker, table in statement_pages[start:start + args.concurrency]]
+            [thread.start() for thread in threads]
+            [thread.join() for thread in threads]
+
+    print(f'concurrency {args.concurrency}')
+
+    with tempfile.TemporaryDirectory() as directory:
+        _write_session(directory, pages)
+        liveinvestmentdata.replay_session(directory)
+
+        download_url = liveinvestmentdata.download_url
+        try:
+            for name, run in (('prices', prices), ('financials', financials)):
+                sections = _measure(f'{name} (sections)', args.pages, run)
+
+                liveinvestmentdata.download_url = _full_parse(download_url)
+                try:
+                    full = _measure(f'{name} (full parse)', args.pages, run)
+                finally:
+                    liveinvestmentdata.download_url = download_url
+
+                print(f'{name:<24} sections use {sections / full:.0%} of the full parse peak')
+        finally:
+            liveinvestmentdata.live_session()
+
+if __name__ == '__main__':
+    main()
@@ -23,6 +23,10 @@ setup(
     package_dir={"":"src"},
     packages=["liveinvestmentdata"],
     install_requires=['beautifulsoup4==4.11.1','requests==2.27.1'],
+    extras_require={'arrow': ['pyarrow']},
+    entry_points={
+        'console_scripts': ['liveinvestmentdata=liveinvestmentdata.cli:main'],
+    },
     keywords=['python','finance'],
     classifiers=[
         'Development Status :: 1 - Planning',
@@ -4,74 +4,154 @@ Simple to use stock, commodity, forex, and cryptocurrency market webscraper, uti
 Easily pull live market prices, news, financial information, and more with simple to use functions. 
 
 Functions:
-    download_url(url: str) -> object
+    download_url(url: str, parse_only=None) -> object
         Downloads the page source of the provided URL
     
 
+    #### Transport ####
+
+    record_session(directory: str) -> None
+        Records every page downloaded from now on into the directory, gzipped and content-addressed,
+        along with each request's url and timing
+
+    replay_session(directory: str, speed=None) -> None
+        Serves every page download from a recorded session instead of the network,
+        at the recorded speed divided by speed, or as fast as possible when speed is None
+
+    live_session() -> None
+        Goes back to downloading pages from the network without recording
+
+    ###################
+
+    #### Symbol Index ####
+
+    set_cache_directory(path: str) -> None
+        Sets where cached data, like the symbol index, is stored
+
+    resolve_symbol(market: str, name: str) -> str
+        Resolves a cryptocurrency or commodity name, ticker, or alias to the slug its site uses,
+        rejecting unknown names before any page is downloaded
+
+    ######################
+
     #### Prices ####
 
     crypto_price(name: str) -> float
         Pulls the price of the provided cryptocurrency name from coinmarketcap.com,
-        the cryptocurrencies full name must be provided in most cases.
+        the name can be its full name, ticker symbol, or coinmarketcap slug
     
-    multiple_crypto_prices(symbol_list: list) -> dict
+    multiple_crypto_prices(symbol_list: list, sink=None) -> dict
         Aquires multiple cryptocurrency prices from the 'crypto_price' function, utlizing threads
         for optimal speed and efficiency
     
     stock_price(ticker: str) -> float
         Pulls the price of the provided stock ticker from marketwatch.com
     
-    multiple_stock_prices(ticker_list: list) -> dict
+    multiple_stock_prices(ticker_list: list, sink=None) -> dict
         Aquires multiple stock prices from the 'stock_price' function,
         utlizing threads for optimal speed and efficiency
 
     commodity_price(name: str) -> float
         Pulls the price of the provided commodity from markets.businessinsider.com
 
-    multiple_commodity_prices(commodities_list: list) -> dict
+    multiple_commodity_prices(commodities_list: list, sink=None) -> dict
         Aquires multiple commodity prices from the 'commodity_price' function,
         utlizing threads for optimal speed and efficiency
 
     ##############
 
+    #### Streaming ####
+
+    market_is_open(market: str) -> bool
+        Checks whether the provided market is currently trading, exchange holidays are not accounted for
+
+    watch_prices(stocks=(), cryptos=(), commodities=(), min_interval=5, max_interval=300) -> generator
+        Continuously polls the provided symbols, each on its own schedule, yielding only the
+        prices that have changed since they were last seen
+
+    ###################
+
+    #### Price Board ####
+
+    use_price_board(name='liveinvestmentdata', slots=4096) -> object
+        Publishes every price fetched by the multiple_*_prices functions to a shared-memory board,
+        which other local processes can read from with 'PriceBoard(name).read(market, name)'
+
+    PriceBoard(name='liveinvestmentdata', slots=4096, create=False)
+        A fixed-layout, seqlock protected table of prices and timestamps in shared memory
+
+    #####################
+
+    #### Daemon Client ####
+
+    use_price_daemon(address='127.0.0.1:8765') -> None
+        Routes the stock, crypto, and commodity price functions through a local price daemon,
+        so every process on the machine shares one cache and one fetch stream
+
+    daemon_price(market: str, name: str, address=None) -> float
+        Pulls a price from the local price daemon, which only scrapes it if its cached copy is stale
+
+    subscribe_prices(stocks=(), cryptos=(), commodities=(), address=None) -> generator
+        Subscribes to the local price daemon, which pushes a price whenever it changes
+
+    The daemon itself is run with 'python -m liveinvestmentdata.daemon'
+
+    #######################
+
     #### News ####
 
-    coinmarketcap_news(name: str) -> dict
+    coinmarketcap_news(name: str, sink=None) -> dict
         Pulls news from coinmarketcap.com for the provided cryptocurrency name
     
-    marketwatch_news(ticker: str) -> dict
+    marketwatch_news(ticker: str, sink=None) -> dict
         Pulls news from marketwatch.com for the provided stock ticker
     
-    businessinsider_news(commodity: str) -> dict
+    businessinsider_news(commodity: str, sink=None) -> dict
         Pulls news from markets.businessinsider.com for the provided commodity name        
 
-    stock_news(ticker: str) -> dict
+    stock_news(ticker: str, sink=None) -> dict
         Pulls news for a stock from multiple sources, and filters out repeats
 
-    crypto_news(name: str) -> dict
+    crypto_news(name: str, sink=None) -> dict
         Pulls news for a cryptocurrency from multiple sources, and filters out repeats
 
-    commodity_news(name: str) -> dict
+    commodity_news(name: str, sink=None) -> dict
         Pulls news for a commodity from multiple sources, and filters out repeats
 
     ####################
 
     #### Financials ####
     
-    marketwatch_income_statement(ticker: str, key_data_only=False, time_period='quarter') -> dict
+    marketwatch_income_statement(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict
         Pulls the income statement table from marketwatch.com for a stock
     
-    marketwatch_balance_sheet(ticker: str, key_data_only=False, time_period='quarter') -> dict
+    marketwatch_balance_sheet(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict
         Pulls the balance sheet table from marketwatch.com for a stock
     
-    marketwatch_cash_flow(ticker: str, key_data_only=False, time_period='quarter') -> dict
+    marketwatch_cash_flow(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict
         Pulls the cash flow table from marketwatch.com for a stock
     
-    stock_financial_data(ticker: str, key_data_only=False, time_period='quarter') -> dict
+    stock_financial_data(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict
         Pulls the Income Statement, Balance Sheet, and Cash Flow tables from marketwatch.com for a stock
     
     ####################
 
+    #### Export Sinks ####
+
+    QuoteSink(path=None, format='parquet', batch_size=10000)
+        Collects prices into Arrow record batches, written to a Parquet or CSV file in chunks,
+        and can be passed to the multiple_*_prices functions as their sink
+
+    NewsSink(path=None, format='parquet', batch_size=10000)
+        Collects news stories, and can be passed to the news functions as their sink
+
+    StatementSink(path=None, format='parquet', batch_size=10000)
+        Collects financial statement rows, and can be passed to the financials functions as their sink
+
+    Requires pyarrow, installed with 'pip install liveinvestmentdata[arrow]'
+
+    ######################
+
 '''
 
 from liveinvestmentdata.liveinvestmentdata import *
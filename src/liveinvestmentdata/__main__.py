@@ -0,0 +1,6 @@
+import sys
+
+from liveinvestmentdata.cli import main
+
+
+sys.exit(main())
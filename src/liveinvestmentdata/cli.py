@@ -0,0 +1,243 @@
+'''
+
+Command line runner, which streams large symbol lists through a bounded pool of threads and
+writes each symbol's rows as NDJSON or CSV as soon as it completes, so memory use stays
+constant no matter how many symbols are read, and one slow symbol never holds up the rest.
+Rows come out in the order symbols finish, not the order they were read.
+
+Usage:
+    liveinvestmentdata <command> [symbols file] [options]
+
+    Symbols are read one per line from the file, or from stdin when no file (or '-') is given
+
+Commands:
+    stock-price, crypto-price, commodity-price
+        Rows of symbol, price, error
+
+    stock-news, crypto-news, commodity-news
+        Rows of symbol, source, headline, url, error
+
+    financials
+        Rows of symbol, statement, metric, values, error
+
+Functions:
+    main(argv=None) -> int
+        Runs the command line interface, returning the exit status
+
+'''
+
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import argparse
+import csv
+import json
+import sys
+import time
+
+from liveinvestmentdata import liveinvestmentdata
+
+
+FIELDS = {'price': ['symbol', 'price', 'error'],
+          'news': ['symbol', 'source', 'headline', 'url', 'error'],
+          'financials': ['symbol', 'statement', 'metric', 'values', 'error'],
+         }
+
+
+def _error_rows(symbol: str, error: Exception) -> list:
+    return [{'symbol': symbol, 'error': str(error) or type(error).__name__}]
+
+
+def _price_rows(fetcher):
+    '''
+    Fetches a symbol's price with one of the *_price functions
+
+    :function:: _price_rows(fetcher) -> function
+    '''
+    def fetch(symbol):
+        try:
+            return [{'symbol': symbol, 'price': fetcher(symbol)}]
+        except Exception as error:
+            return _error_rows(symbol, error)
+
+    return fetch
+
+
+def _news_rows(fetcher):
+    '''
+    Fetches a symbol's news with one of the *_news functions
+
+    :function:: _news_rows(fetcher) -> function
+    '''
+    def fetch(symbol):
+        try:
+            sources = fetcher(symbol)
+        except Exception as error:
+            return _error_rows(symbol, error)
+
+        return [{'symbol': symbol, 'source': source, 'headline': headline, 'url': url}
+                for source, stories in sources.items()
+                for headline, url in stories.items()]
+
+    return fetch
+
+
+def _financial_rows(key_data_only: bool, time_period: str):
+    '''
+    Fetches a ticker's financial statements with 'stock_financial_data'
+
+    :function:: _financial_rows(key_data_only: bool, time_period: str) -> function
+    '''
+    def fetch(symbol):
+        try:
+            statements = liveinvestmentdata.stock_financial_data(symbol, key_data_only, time_period)
+        except Exception as error:
+            return _error_rows(symbol, error)
+
+        rows = []
+        for statement, metrics in statements.items():
+            if metrics is None:
+                rows.append({'symbol': symbol, 'statement': statement, 'error': 'Could not fetch statement'})
+                continue
+            for metric, values in metrics.items():
+                rows.append({'symbol': symbol, 'statement': statement, 'metric': metric, 'values': values})
+
+        return rows
+
+    return fetch
+
+
+def _read_symbols(file) -> object:
+    '''
+    Lazily reads one symbol per line, skipping blank lines
+
+    :function:: _read_symbols(file) -> generator
+    '''
+    for line in file:
+        symbol = line.strip()
+        if symbol:
+            yield symbol
+
+
+def _writer(output_format: str, fields: list, stream) -> object:
+    '''
+    Returns a function that writes one row to the stream in the chosen format
+
+    :function:: _writer(output_format: str, fields: list, stream) -> function
+    '''
+    if output_format == 'csv':
+        writer = csv.DictWriter(stream, fields, extrasaction='ignore')
+        writer.writeheader()
+
+        def write(row):
+            if isinstance(row.get('values'), list):
+                row = dict(row, values='|'.join(row['values']))
+            writer.writerow(row)
+
+        return write
+
+    def write(row):
+        stream.write(json.dumps(row) + '\n')
+
+    return write
+
+
+def main(argv=None) -> int:
+    '''
+    Runs the command line interface
+
+    :function:: main(argv=None) -> int
+
+    Args:
+        argv (list, *optional):
+            The arguments to parse, defaults to sys.argv
+
+    Returns:
+        int: The exit status, 0 on success and 2 if the deadline cut the run short
+
+    '''
+    commands = {'stock-price': ('price', _price_rows(liveinvestmentdata.stock_price)),
+                'crypto-price': ('price', _price_rows(liveinvestmentdata.crypto_price)),
+                'commodity-price': ('price', _price_rows(liveinvestmentdata.commodity_price)),
+                'stock-news': ('news', _news_rows(liveinvestmentdata.stock_news)),
+                'crypto-news': ('news', _news_rows(liveinvestmentdata.crypto_news)),
+                'commodity-news': ('news', _news_rows(liveinvestmentdata.commodity_news)),
+                'financials': ('financials', None),
+               }
+
+    parser = argparse.ArgumentParser(prog='liveinvestmentdata',
+                                     description='Stream prices, news, and financials for a list of symbols')
+    parser.add_argument('command', choices=commands)
+    parser.add_argument('symbols', nargs='?', default='-',
+                        help="file with one symbol per line, '-' or omitted reads stdin")
+    parser.add_argument('-f', '--format', choices=['ndjson', 'csv'], default='ndjson')
+    parser.add_argument('-c', '--concurrency', type=int, default=16,
+                        help='how many symbols are fetched at once, default is 16')
+    parser.add_argument('-d', '--deadline', type=float,
+                        help='seconds after which no new symbols are started')
+    parser.add_argument('-t', '--timeout', type=float, default=30,
+                        help='seconds to wait on a single page, default is 30')
+    parser.add_argument('--cache-dir', help='where cached data, like the symbol index, is stored')
+    parser.add_argument('--record', metavar='DIR', help='record every page downloaded into a session directory')
+    parser.add_argument('--replay', metavar='DIR', help='serve every page from a recorded session directory')
+    parser.add_argument('--replay-speed', type=float,
+                        help='replay at the recorded speed times this, default is as fast as possible')
+    parser.add_argument('--key-data-only', action='store_true',
+                        help='only pull the key data marketwatch highlights, for financials')
+    parser.add_argument('--time-period', choices=['quarter', 'annual'], default='quarter',
+                        help='which financial tables to pull, default is quarter')
+    args = parser.parse_args(argv)
+
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+    if args.record and args.replay:
+        parser.error('--record and --replay can not be used together')
+
+    if args.cache_dir:
+        liveinvestmentdata.set_cache_directory(args.cache_dir)
+    liveinvestmentdata.request_timeout = args.timeout
+
+    if args.record:
+        liveinvestmentdata.record_session(args.record)
+    elif args.replay:
+        liveinvestmentdata.replay_session(args.replay, args.replay_speed)
+
+    kind, fetch = commands[args.command]
+    if kind == 'financials':
+        fetch = _financial_rows(args.key_data_only, args.time_period)
+
+    started = time.monotonic()
+    source = sys.stdin if args.symbols == '-' else open(args.symbols)
+    write = _writer(args.format, FIELDS[kind], sys.stdout)
+
+    try:
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            symbols = _read_symbols(source)
+            in_flight = set()
+            status = None
+
+            while True:
+                #Keeps up to --concurrency symbols in flight, starting a new one as each finishes
+                while status is None and len(in_flight) < args.concurrency:
+                    symbol = next(symbols, None)
+                    if symbol is None:
+                        status = 0
+                    elif args.deadline is not None and time.monotonic() - started >= args.deadline:
+                        print(f'liveinvestmentdata: deadline reached, stopping before {symbol}', file=sys.stderr)
+                        status = 2
+                    else:
+                        in_flight.add(pool.submit(fetch, symbol))
+
+                if not in_flight:
+                    return status
+
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for row in future.result():
+                        write(row)
+                sys.stdout.flush()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,290 @@
+'''
+
+Local caching price daemon, which serves any number of client processes from one shared
+cache and one fetch stream. Requests for the same symbols are coalesced into a single
+batched scrape, and subscribers are pushed each price as it changes.
+
+Run with:
+    python -m liveinvestmentdata.daemon [--address 127.0.0.1:8765] [--max-age 5]
+
+Endpoints:
+    GET /price/<market>/<name>
+        Returns {"market", "name", "price", "time"} as JSON, scraping only if the cached price is stale
+
+    GET /subscribe?stock=aapl,tsla&crypto=bitcoin&commodity=gold
+        Streams {"market", "name", "price", "time"} JSON lines whenever a subscribed price changes
+
+Functions:
+    serve_prices(address='127.0.0.1:8765', max_age=5) -> None
+        Runs the price daemon until interrupted
+
+'''
+
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from threading import Condition, Thread
+from urllib.parse import parse_qs, unquote, urlsplit
+import argparse
+import json
+import os
+import queue
+import socket
+import stat
+import time
+
+from liveinvestmentdata import liveinvestmentdata
+
+
+MARKETS = ('stock', 'crypto', 'commodity')
+
+#How long in seconds a cached price is served before it's scraped again
+cache_max_age = 5
+
+#How long in seconds a client waits on a scrape before giving up
+request_timeout = 60
+
+#(market, name) -> (price, time fetched), the price is None when the scrape failed
+cache = {}
+
+#Symbols that a client is currently waiting on
+pending = set()
+
+#Each subscriber is a (set of (market, name) pairs, queue of updates) pair
+subscribers = []
+
+#Guards all of the shared state above, and wakes the fetch thread and waiting clients
+condition = Condition()
+
+#How many connections can wait to be accepted, so dozens of clients connecting at once aren't refused
+listen_backlog = 1024
+
+
+def _fetch_loop() -> None:
+    '''
+    Scrapes every stale symbol that's either pending or subscribed to, in one batch per market,
+    then wakes any waiting clients and pushes changed prices to subscribers
+
+    :function:: _fetch_loop() -> None
+    '''
+    fetchers = {'stock': liveinvestmentdata.multiple_stock_prices,
+                'crypto': liveinvestmentdata.multiple_crypto_prices,
+                'commodity': liveinvestmentdata.multiple_commodity_prices,
+               }
+
+    while True:
+        with condition:
+            while True:
+                now = time.time()
+                wanted = set(pending)
+                for symbols, _ in subscribers:
+                    wanted |= symbols
+
+                stale = [key for key in wanted if key not in cache or now - cache[key][1] >= cache_max_age]
+                if stale:
+                    break
+
+                #Sleeps until the oldest wanted price expires, or a client asks for something new
+                if wanted:
+                    condition.wait(min(cache[key][1] for key in wanted) + cache_max_age - now)
+                else:
+                    condition.wait()
+
+        #Scrapes outside of the lock so clients can still be served from the cache
+        prices = {}
+        for market in MARKETS:
+            names = [name for kind, name in stale if kind == market]
+            if names:
+                for name, price in fetchers[market](names).items():
+                    prices[(market, name)] = price
+        fetched_at = time.time()
+
+        with condition:
+            for key in stale:
+                previous = cache.get(key, (None, None))[0]
+                price = prices.get(key)
+                cache[key] = (price, fetched_at)
+                pending.discard(key)
+
+                if price is not None and price != previous:
+                    for symbols, updates in subscribers:
+                        if key in symbols:
+                            updates.put((key, price, fetched_at))
+
+            condition.notify_all()
+
+
+class _PriceHandler(BaseHTTPRequestHandler):
+    '''
+    Serves cached prices and price subscriptions
+    '''
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = [unquote(part) for part in url.path.split('/') if part]
+
+        if len(parts) == 3 and parts[0] == 'price' and parts[1] in MARKETS:
+            self._price((parts[1], parts[2]))
+        elif parts == ['subscribe']:
+            self._subscribe(parse_qs(url.query))
+        else:
+            self._send_json(404, {'error': f'Unknown path {url.path}'})
+
+    def _price(self, key: tuple) -> None:
+        requested_at = time.time()
+
+        with condition:
+            if key not in cache or requested_at - cache[key][1] >= cache_max_age:
+                pending.add(key)
+                condition.notify_all()
+                fetched = condition.wait_for(lambda: key in cache and cache[key][1] >= requested_at,
+                                             timeout=request_timeout)
+                if not fetched:
+                    self._send_json(504, {'error': f'Timed out fetching {key[0]} {key[1]}'})
+                    return
+            price, fetched_at = cache[key]
+
+        if price is None:
+            self._send_json(404, {'error': f'Could not fetch {key[0]} {key[1]}'})
+        else:
+            self._send_json(200, {'market': key[0], 'name': key[1], 'price': price, 'time': fetched_at})
+
+    def _subscribe(self, query: dict) -> None:
+        symbols = set()
+        for market in MARKETS:
+            for names in query.get(market, []):
+                symbols.update((market, name) for name in names.split(',') if name)
+
+        updates = queue.Queue()
+        subscriber = (symbols, updates)
+
+        with condition:
+            #Sends whatever is already cached straight away
+            for key in symbols:
+                if key in cache and cache[key][0] is not None:
+                    updates.put((key, *cache[key]))
+            subscribers.append(subscriber)
+            condition.notify_all()
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.end_headers()
+
+        try:
+            while True:
+                try:
+                    (market, name), price, fetched_at = updates.get(timeout=15)
+                    line = json.dumps({'market': market, 'name': name, 'price': price, 'time': fetched_at})
+                except queue.Empty:
+                    #Keep-alive, which also detects clients that have gone away
+                    line = ''
+                self.wfile.write(line.encode() + b'\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with condition:
+                subscribers.remove(subscriber)
+
+    def _send_json(self, status: int, data: dict) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        #Unix socket clients have no address
+        return str(self.client_address[0]) if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+    request_queue_size = listen_backlog
+
+
+class _ThreadingTCPHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = listen_backlog
+
+
+def _remove_stale_socket(path: str) -> None:
+    '''
+    Removes a socket left behind by a daemon that's no longer running, refusing to touch
+    anything that isn't a socket, or a socket another daemon is still listening on
+
+    :function:: _remove_stale_socket(path: str) -> None
+    '''
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f'{path} already exists and is not a socket')
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.remove(path)
+        return
+    finally:
+        probe.close()
+
+    raise OSError(f'A price daemon is already listening on {path}')
+
+
+def serve_prices(address=liveinvestmentdata.DEFAULT_DAEMON_ADDRESS, max_age=5) -> None:
+    '''
+    Runs the price daemon until interrupted
+
+    :function:: serve_prices(address='127.0.0.1:8765', max_age=5) -> None
+
+    Args:
+        address (str, *optional):
+            Either 'host:port', or the path of a unix socket to bind to
+
+        max_age (float, *optional):
+            How long in seconds a cached price is served before it's scraped again,
+            which is also how often subscribed prices are refreshed
+
+    '''
+    global cache_max_age
+
+    cache_max_age = max_age
+
+    #The daemon always scrapes for itself
+    liveinvestmentdata.use_price_daemon(None)
+
+    host, port = liveinvestmentdata._split_address(address)
+    if port is None:
+        _remove_stale_socket(host)
+        server = _ThreadingUnixHTTPServer(host, _PriceHandler)
+    else:
+        server = _ThreadingTCPHTTPServer((host, port), _PriceHandler)
+
+    Thread(target=_fetch_loop, daemon=True).start()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if port is None and os.path.exists(host) and stat.S_ISSOCK(os.stat(host).st_mode):
+            os.remove(host)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local caching price daemon for liveinvestmentdata')
+    parser.add_argument('--address', default=liveinvestmentdata.DEFAULT_DAEMON_ADDRESS,
+                        help="'host:port' or a unix socket path to listen on")
+    parser.add_argument('--max-age', type=float, default=5,
+                        help='seconds a cached price is served before being scraped again')
+    args = parser.parse_args()
+
+    serve_prices(args.address, args.max_age)
@@ -4,53 +4,117 @@ Simple to use stock, commodity, forex, and cryptocurrency market webscraper, uti
 Easily pull live market prices, news, financial information, and more with simple to use functions.
 
 Functions:
-    download_url(url: str) -> object
+    download_url(url: str, parse_only=None) -> object
         Downloads the page source of the provided URL
     
+    #### Transport ####
+
+    record_session(directory: str) -> None
+        Records every page downloaded from now on into the directory, gzipped and content-addressed,
+        along with each request's url and timing
+
+    replay_session(directory: str, speed=None) -> None
+        Serves every page download from a recorded session instead of the network,
+        at the recorded speed divided by speed, or as fast as possible when speed is None
+
+    live_session() -> None
+        Goes back to downloading pages from the network without recording
+
+    ###################
+
+    #### Symbol Index ####
+
+    set_cache_directory(path: str) -> None
+        Sets where cached data, like the symbol index, is stored
+
+    resolve_symbol(market: str, name: str) -> str
+        Resolves a cryptocurrency or commodity name, ticker, or alias to the slug its site uses,
+        rejecting unknown names before any page is downloaded
+
+    ######################
+
 #### Prices ####
 
     crypto_price(name: str) -> float
         Pulls the price of the provided cryptocurrency name from coinmarketcap.com,
-        the cryptocurrencies full name must be provided in most cases.
+        the name can be its full name, ticker symbol, or coinmarketcap slug
     
-    multiple_crypto_prices(symbol_list: list) -> dict
+    multiple_crypto_prices(symbol_list: list, sink=None) -> dict
         Aquires multiple cryptocurrency prices from the 'crypto_price' function, utlizing threads
         for optimal speed and efficiency
     
     stock_price(ticker: str) -> float
         Pulls the price of the provided stock ticker from marketwatch.com
     
-    multiple_stock_prices(ticker_list: list) -> dict
+    multiple_stock_prices(ticker_list: list, sink=None) -> dict
         Aquires multiple stock prices from the 'stock_price' function,
         utlizing threads for optimal speed and efficiency
 
     commodity_price(name: str) -> float
         Pulls the price of the provided commodity from markets.businessinsider.com
 
-    multiple_commodity_prices(commodities_list: list) -> dict
+    multiple_commodity_prices(commodities_list: list, sink=None) -> dict
         Aquires multiple commodity prices from the 'commodity_price' function,
         utlizing threads for optimal speed and efficiency
 
     ##############
 
+    #### Streaming ####
+
+    market_is_open(market: str) -> bool
+        Checks whether the provided market is currently trading, exchange holidays are not accounted for
+
+    watch_prices(stocks=(), cryptos=(), commodities=(), min_interval=5, max_interval=300) -> generator
+        Continuously polls the provided symbols, each on its own schedule, yielding only the
+        prices that have changed since they were last seen
+
+    ###################
+
+    #### Price Board ####
+
+    use_price_board(name='liveinvestmentdata', slots=4096) -> object
+        Publishes every price fetched by the multiple_*_prices functions to a shared-memory board,
+        which other local processes can read from with 'PriceBoard(name).read(market, name)'
+
+    PriceBoard(name='liveinvestmentdata', slots=4096, create=False)
+        A fixed-layout, seqlock protected table of prices and timestamps in shared memory
+
+    #####################
+
+    #### Daemon Client ####
+
+    use_price_daemon(address='127.0.0.1:8765') -> None
+        Routes the stock, crypto, and commodity price functions through a local price daemon,
+        so every process on the machine shares one cache and one fetch stream
+
+    daemon_price(market: str, name: str, address=None) -> float
+        Pulls a price from the local price daemon, which only scrapes it if its cached copy is stale
+
+    subscribe_prices(stocks=(), cryptos=(), commodities=(), address=None) -> generator
+        Subscribes to the local price daemon, which pushes a price whenever it changes
+
+    The daemon itself is run with 'python -m liveinvestmentdata.daemon'
+
+    #######################
+
     #### News ####
 
-    coinmarketcap_news(name: str) -> dict
+    coinmarketcap_news(name: str, sink=None) -> dict
         Pulls news from coinmarketcap.com for the provided cryptocurrency name
     
-    marketwatch_news(ticker: str) -> dict
+    marketwatch_news(ticker: str, sink=None) -> dict
         Pulls news from marketwatch.com for the provided stock ticker
     
-    businessinsider_news(commodity: str) -> dict
+    businessinsider_news(commodity: str, sink=None) -> dict
         Pulls news from markets.businessinsider.com for the provided commodity name        
 
-    stock_news(ticker: str) -> dict
+    stock_news(ticker: str, sink=None) -> dict
         Pulls news for a stock from multiple sources, and filters out repeats
 
-    crypto_news(name: str) -> dict
+    crypto_news(name: str, sink=None) -> dict
         Pulls news for a cryptocurrency from multiple sources, and filters out repeats
 
-    commodity_news(name: str) -> dict
+    commodity_news(name: str, sink=None) -> dict
         Pulls news for a commodity from multiple sources, and filters out repeats
 
 
@@ -58,114 +122,375 @@ Functions:
 
     #### Financials ####
     
-    marketwatch_income_statement(ticker: str, key_data_only=False, time_period='quarter') -> dict
+    marketwatch_income_statement(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict
         Pulls the income statement table from marketwatch.com for a stock
-    marketwatch_balance_sheet(ticker: str, key_data_only=False, time_period='quarter') -> dict
+    marketwatch_balance_sheet(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict
         Pulls the balance sheet table from marketwatch.com for a stock
-    marketwatch_cash_flow(ticker: str, key_data_only=False, time_period='quarter') -> dict
+    marketwatch_cash_flow(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict
         Pulls the cash flow table from marketwatch.com for a stock
-    stock_financial_data(ticker: str, key_data_only=False, time_period='quarter') -> dict
+    stock_financial_data(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict
         Pulls the Income Statement, Balance Sheet, and Cash Flow tables from marketwatch.com for a stock
     
     ####################
 
+    #### Export Sinks ####
+
+    QuoteSink(path=None, format='parquet', batch_size=10000)
+        Collects prices into Arrow record batches, written to a Parquet or CSV file in chunks,
+        and can be passed to the multiple_*_prices functions as their sink
+
+    NewsSink(path=None, format='parquet', batch_size=10000)
+        Collects news stories, and can be passed to the news functions as their sink
+
+    StatementSink(path=None, format='parquet', batch_size=10000)
+        Collects financial statement rows, and can be passed to the financials functions as their sink
+
+    Requires pyarrow, installed with 'pip install liveinvestmentdata[arrow]'
+
+    ######################
+
 '''
 
 
-from threading import Thread
-import requests
-from bs4 import BeautifulSoup as bs
+from threading import Lock, Thread
+from bs4 import BeautifulSoup as bs, SoupStrainer
+from datetime import datetime, timedelta, timezone
+import difflib
+import http.client
+import json
+import os
+import re
+import socket
+import tempfile
 import time
+import warnings
+from urllib.parse import quote, urlencode
+
+from liveinvestmentdata import transport
+from liveinvestmentdata.priceboard import PriceBoard
+from liveinvestmentdata.sinks import NewsSink, QuoteSink, StatementSink
+from liveinvestmentdata.transport import live_session, record_session, replay_session
+
+
+#The address of a local price daemon, when set the price functions are served by it instead of scraping
+price_daemon_address = os.environ.get('LIVEINVESTMENTDATA_DAEMON')
+
+DEFAULT_DAEMON_ADDRESS = '127.0.0.1:8765'
 
+#A shared-memory price board the multiple_*_prices functions publish to, see 'use_price_board'
+price_board = None
 
-def download_url(url: str) -> object:
+#Where cached data, like the symbol index, is stored
+cache_directory = os.environ.get('LIVEINVESTMENTDATA_CACHE',
+                                 os.path.join(os.path.expanduser('~'), '.cache', 'liveinvestmentdata'))
+
+#How long in seconds a symbol index is used before it's rebuilt from the listing pages
+symbol_index_max_age = 24 * 60 * 60
+
+#How long in seconds to wait on a listing page while building a symbol index
+symbol_index_timeout = 10
+
+#How long in seconds to wait before retrying a failed index build, doubled after each failure up to an hour
+symbol_index_retry = 60
+
+#How long in seconds 'download_url' waits on a site before giving up, None waits forever
+request_timeout = None
+
+
+def download_url(url: str, parse_only=None) -> object:
     '''
     Downloads the page source of the provided URL
 
-    :function:: download_url(url: str) -> object
+    :function:: download_url(url: str, parse_only=None) -> object
 
     Args:
         url (str):
             The url of the page you want downloaded
 
+        parse_only (SoupStrainer, *optional):
+            Only builds the parts of the page that match, which keeps the parse tree small
+
     Returns:
         object: 
             A class object containing the page source code, with methods for filtering the data
     '''
-    page = requests.get(url)
+    page = transport.fetch(url, timeout=request_timeout)
+
+    return bs(page, 'html.parser', parse_only=parse_only)
+
+
+##################### Symbol Index ##########################
+
+
+#Market -> (time built, {alias: slug}), filled lazily by '_load_symbol_index'
+symbol_indexes = {}
+
+#Market -> (failed builds in a row, time the next build may be tried)
+_symbol_index_failures = {}
+
+_symbol_index_lock = Lock()
+
+
+def set_cache_directory(path: str) -> None:
+    '''
+    Sets where cached data, like the symbol index, is stored
+
+    :function:: set_cache_directory(path: str) -> None
+
+    Args:
+        path (str):
+            The directory to use, which is created when first written to. The
+            LIVEINVESTMENTDATA_CACHE environment variable sets this on import
+
+    '''
+    global cache_directory
+
+    cache_directory = path
+    symbol_indexes.clear()
+    _symbol_index_failures.clear()
+
+
+def _build_crypto_index() -> dict:
+    '''
+    Maps every cryptocurrency's slug, name, and ticker symbol to its coinmarketcap.com slug,
+    using the coin map behind coinmarketcap's listing pages
+
+    :function:: _build_crypto_index() -> dict
+    '''
+    response = transport.fetch('https://api.coinmarketcap.com/data-api/v3/map/all?listing_status=active',
+                               timeout=symbol_index_timeout)
+    coins = json.loads(response)['data']['cryptoCurrencyMap']
+
+    #Ticker symbols aren't unique, so the highest ranked coin claims each one
+    coins.sort(key=lambda coin: coin.get('rank') or float('inf'))
+
+    index = {}
+    for coin in coins:
+        for alias in (coin['slug'], coin['name'], coin['symbol']):
+            index.setdefault(alias.strip().lower(), coin['slug'])
+
+    return index
+
+
+def _build_commodity_index() -> dict:
+    '''
+    Maps every commodity's URL name and display name to its markets.businessinsider.com URL name,
+    using businessinsider's commodity listing page
+
+    :function:: _build_commodity_index() -> dict
+    '''
+    commodity_link = re.compile(r'/commodities/([\w-]+)-price$')
+    page = bs(transport.fetch('https://markets.businessinsider.com/commodities', timeout=symbol_index_timeout),
+              'html.parser', parse_only=SoupStrainer('a', href=commodity_link))
+
+    index = {}
+    for link in page.find_all('a'):
+        slug = commodity_link.search(link.get('href')).group(1)
+        for alias in (slug, slug.replace('-', ' '), link.text):
+            if alias.strip():
+                index.setdefault(alias.strip().lower(), slug)
+
+    page.decompose()
+    return index
+
+
+def _load_symbol_index(market: str) -> dict:
+    '''
+    Returns the symbol index for a market, from memory, the cache directory, or by rebuilding it
+    once it's older than 'symbol_index_max_age'. Failed rebuilds keep serving the stale index,
+    and aren't retried until 'symbol_index_retry' seconds later, doubling with each failure
+
+    :function:: _load_symbol_index(market: str) -> dict
+
+    Returns:
+        dict: The key is a lowercase alias, and the value is the slug, or None if no index could be loaded
+    '''
+    builders = {'crypto': _build_crypto_index,
+                'commodity': _build_commodity_index,
+               }
+
+    #Only one thread builds the index, the rest wait for it
+    with _symbol_index_lock:
+        built, index = symbol_indexes.get(market, (0, None))
+        failures, retry_at = _symbol_index_failures.get(market, (0, 0))
+        if time.time() - built < symbol_index_max_age or time.time() < retry_at:
+            return index
+
+        path = os.path.join(cache_directory, f'{market}_symbols.json')
+        try:
+            with open(path) as file:
+                cached = json.load(file)
+            if cached['built'] > built:
+                built, index = cached['built'], cached['index']
+        except (OSError, ValueError, KeyError):
+            pass
+
+        if time.time() - built >= symbol_index_max_age:
+            try:
+                index = builders[market]()
+                built = time.time()
+            except Exception:
+                #Keeps serving the stale index, or none at all, until it's time to try again
+                failures += 1
+                backoff = min(symbol_index_retry * 2 ** (failures - 1), 60 * 60)
+                _symbol_index_failures[market] = (failures, time.time() + backoff)
+                symbol_indexes[market] = (built, index)
+                return index
+
+            _symbol_index_failures.pop(market, None)
+            _save_symbol_index(path, built, index)
+
+        symbol_indexes[market] = (built, index)
+        return index
+
+
+def _save_symbol_index(path: str, built: float, index: dict) -> None:
+    '''
+    Writes a symbol index to the cache directory through its own temporary file, so processes
+    saving at the same time can't interleave. An unwritable cache only costs other processes a
+    rebuild, so it's warned about rather than raised
+
+    :function:: _save_symbol_index(path: str, built: float, index: dict) -> None
+    '''
+    temporary = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(descriptor, 'w') as file:
+            json.dump({'built': built, 'index': index}, file)
+        os.replace(temporary, path)
+    except OSError as error:
+        if temporary is not None and os.path.exists(temporary):
+            os.remove(temporary)
+        warnings.warn(f'Could not cache the symbol index at {path}: {error}')
+
+
+def resolve_symbol(market: str, name: str) -> str:
+    '''
+    Resolves a cryptocurrency or commodity name, ticker, or alias to the slug its site uses,
+    rejecting unknown names before any page is downloaded
+
+    :function:: resolve_symbol(market: str, name: str) -> str
+
+    Args:
+        market (str):
+            Either 'crypto' or 'commodity'
+
+        name (str):
+            Any name, ticker symbol, or slug, e.g 'BTC', 'Bitcoin', or 'bitcoin'
+
+    Returns:
+        str:
+            The slug, or the name unchanged if no index could be loaded
+
+    '''
+    index = _load_symbol_index(market)
+    if not index:
+        return name
+
+    alias = name.strip().lower()
+    if alias in index:
+        return index[alias]
+
+    suggestions = difflib.get_close_matches(alias, index.keys(), n=3)
+    message = f"Unknown {market} '{name}'"
+    if suggestions:
+        message += ', did you mean ' + ' or '.join(f"'{suggestion}'" for suggestion in suggestions) + '?'
+
+    raise AttributeError(message)
+
+
+
+#############################################################
+
 
-    return bs(page.content, 'html.parser')
 
 
 ####################### Price  ################################
 
+
 def crypto_price(name: str) -> float:
     '''
     Pulls the price of the provided cryptocurrency name from coinmarketcap.com,
-    the cryptocurrencies full name must be provided in most cases.
+    the name can be its full name, ticker symbol, or coinmarketcap slug
 
     :function:: crypto_price(name: str) -> float
 
     Args:
         name (str):
-            The full name of the cryptocurrency your searching for
+            The name or ticker symbol of the cryptocurrency your searching for
 
     Returns:
         float:
             The floating-point integer of the price, as provided by coinmarketcap.com
 
     '''
-    page = download_url(f"https://coinmarketcap.com/currencies/{name}")
-
-    #Scrapes the page source for the price
-    s = page.find('div', class_='priceValue')
-    try:
-        price = s.find_all('span')[0].text
-    except AttributeError:
-        raise AttributeError('Crypto name must be spelled correctly')
-
-    #Removes uncessary characters from the price
-    for character in price:
+    if price_daemon_address:
+        stripped_price = daemon_price('crypto', name)
+    else:
+        slug = resolve_symbol('crypto', name)
+        page = download_url(f"https://coinmarketcap.com/currencies/{slug}",
+                            parse_only=SoupStrainer('div', class_='priceValue'))
+
+        #Scrapes the page source for the price
+        s = page.find('div', class_='priceValue')
         try:
-            int(character)
-        except ValueError:
-            if character != '.':
-                price = price.replace(character, '')
-    stripped_price = float(price)
+            price = s.find_all('span')[0].text
+        except AttributeError:
+            raise AttributeError('Crypto name must be spelled correctly')
+        finally:
+            page.decompose()
 
-    #Either returns the price directly, or through a shared dictionary for multi-threaded use
-    try:
-        shared_crypto_price_dict[name] = stripped_price
-    except NameError:
-        return stripped_price
+        #Removes uncessary characters from the price
+        for character in price:
+            try:
+                int(character)
+            except ValueError:
+                if character != '.':
+                    price = price.replace(character, '')
+        stripped_price = float(price)
+
+    return stripped_price
 
 
-def multiple_crypto_prices(name_list: list) -> dict:
+def multiple_crypto_prices(name_list: list, sink=None) -> dict:
     '''
     Aquires multiple cryptocurrency prices from the 'crypto_price' function, utlizing threads
     for optimal speed and efficiency
 
-    :function:: multiple_crypto_prices(symbol_list: list) -> dict
+    :function:: multiple_crypto_prices(symbol_list: list, sink=None) -> dict
 
     Args:
         name_list (list):
             A list in which each item is a cryptocurrency you want the price of
 
+        sink (QuoteSink, *optional):
+            Appends each price to the sink as soon as it's scraped, instead of collecting a dictionary
+
     Returns:
         dict:
             A dicitonary in which the key is the cryptocurrency name,
-            and the value is the price
+            and the value is the price, or the sink if one was passed
 
     '''
-    #Utilizing a global variable for shared memory amongst threads
-    global shared_crypto_price_dict
+    prices = {}
+
+    #Each thread either collects its price, or appends it to the sink as soon as it's scraped
+    def fetch(name):
+        price = crypto_price(name)
+        if sink is None:
+            prices[name] = price
+        else:
+            timestamp = time.time()
+            sink.add('crypto', name, price, timestamp)
+            if price_board is not None:
+                price_board.write_many('crypto', {name: price}, timestamp)
 
-    shared_crypto_price_dict = {}
     still_alive = []
     
     #Starts a new thread for each item in the list
     for name in name_list:
-        t = Thread(target=crypto_price, args=(name,))
+        t = Thread(target=fetch, args=(name,))
         t.start()
         still_alive.append(t)
 
@@ -175,7 +500,13 @@ def multiple_crypto_prices(name_list: list) -> dict:
         [still_alive.remove(item) for item in removal]
         time.sleep(.01)
 
-    return shared_crypto_price_dict
+    if sink is not None:
+        return sink
+
+    if price_board is not None:
+        price_board.write_many('crypto', prices)
+
+    return prices
 
 
 
@@ -193,50 +524,65 @@ def stock_price(ticker: str) -> float:
         float: The floating-point integer of the price, provided by marketwatch.com
 
     '''
-    page = download_url(f"https://www.marketwatch.com/investing/stock/{ticker}")
+    if price_daemon_address:
+        price = daemon_price('stock', ticker)
+    else:
+        page = download_url(f"https://www.marketwatch.com/investing/stock/{ticker}",
+                            parse_only=SoupStrainer('div', class_='intraday__data'))
 
-    #Scrapes the page source for the price, and removes unecessary characters
-    s = page.find('div', class_='intraday__data')
-    price = s.find_all('h2')[0].text.strip()
-    for character in price:
-        try:
-            int(character)
-        except ValueError:
-            if character != '.':
-                price = price.replace(character, '')
-    
-    price = float(price)
+        #Scrapes the page source for the price, and removes unecessary characters
+        s = page.find('div', class_='intraday__data')
+        price = s.find_all('h2')[0].text.strip()
+        page.decompose()
+        for character in price:
+            try:
+                int(character)
+            except ValueError:
+                if character != '.':
+                    price = price.replace(character, '')
 
-    try:
-        shared_stock_dict[ticker] = price
-    except NameError:
-        return price
+        price = float(price)
 
+    return price
 
-def multiple_stock_prices(ticker_list: list):
+
+def multiple_stock_prices(ticker_list: list, sink=None):
     '''
     Aquires multiple stock prices from the 'stock_price' function,
     utlizing threads for optimal speed and efficiency                                                                                             
 
-    :function:: multiple_stock_prices(ticker_list: list) -> dict 
+    :function:: multiple_stock_prices(ticker_list: list, sink=None) -> dict 
 
     Args:
         ticker_list (list):
             A list in which each item is a stock you want the price of                                                                                 
 
+        sink (QuoteSink, *optional):
+            Appends each price to the sink as soon as it's scraped, instead of collecting a dictionary
+
     Returns:
         dict: 
-            A dicitonary in which the key is the stock name, and the value is the price    
+            A dicitonary in which the key is the stock name, and the value is the price,
+            or the sink if one was passed
     '''
-    #Utilizing a global variable for shared memory amongst threads
-    global shared_stock_dict
+    prices = {}
+
+    #Each thread either collects its price, or appends it to the sink as soon as it's scraped
+    def fetch(ticker):
+        price = stock_price(ticker)
+        if sink is None:
+            prices[ticker] = price
+        else:
+            timestamp = time.time()
+            sink.add('stock', ticker, price, timestamp)
+            if price_board is not None:
+                price_board.write_many('stock', {ticker: price}, timestamp)
 
-    shared_stock_dict = {}
     still_alive = []
     
     #Starts a new thread for each item in the list
     for ticker in ticker_list:
-        t = Thread(target=stock_price, args=(ticker,))
+        t = Thread(target=fetch, args=(ticker,))
         t.start()
         still_alive.append(t)
 
@@ -246,7 +592,13 @@ def multiple_stock_prices(ticker_list: list):
         [still_alive.remove(item) for item in removal]
         time.sleep(.01)
 
-    return shared_stock_dict
+    if sink is not None:
+        return sink
+
+    if price_board is not None:
+        price_board.write_many('stock', prices)
+
+    return prices
 
 
 
@@ -264,42 +616,58 @@ def commodity_price(name: str) -> float:
         float: The floating-point integer of the price, provided by markets.businessinsider.com
 
     '''
-    url = f'https://markets.businessinsider.com/commodities/{name}-price'
-    page = download_url(url)
+    if price_daemon_address:
+        price = daemon_price('commodity', name)
+    else:
+        slug = resolve_symbol('commodity', name)
+        url = f'https://markets.businessinsider.com/commodities/{slug}-price'
+        page = download_url(url, parse_only=SoupStrainer('div', class_='price-section__values'))
 
-    #Scrapes the page source for the price, and removes unecessary characters
-    s = page.find('div', class_='price-section__values')
-    price = float(s.find('span').text.strip())
+        #Scrapes the page source for the price, and removes unecessary characters
+        s = page.find('div', class_='price-section__values')
+        price = float(s.find('span').text.strip())
+        page.decompose()
 
-    try:
-        shared_commodity_dict[name] = price
-    except NameError:
-        return price
+    return price
 
 
 
-def multiple_commodity_prices(commodities_list: list) -> dict:
+def multiple_commodity_prices(commodities_list: list, sink=None) -> dict:
     '''
     Aquires multiple commodity prices from the 'commodity_price' function,
     utlizing threads for optimal speed and efficiency                                                                                             
 
-    :function:: multiple_commodity_prices(commodities_list: list) -> dict                                                                                           
+    :function:: multiple_commodity_prices(commodities_list: list, sink=None) -> dict                                                                                           
     Args:
         commodities_list (list):
             A list in which each item is a commodity you want the price of                                                                                 
+
+        sink (QuoteSink, *optional):
+            Appends each price to the sink as soon as it's scraped, instead of collecting a dictionary
+
     Returns:
         dict: 
             A dicitonary in which the key is the commodity name,                                                                                 
-            and the value is the price    
+            and the value is the price, or the sink if one was passed
     '''
-    global shared_commodity_dict
+    prices = {}
+
+    #Each thread either collects its price, or appends it to the sink as soon as it's scraped
+    def fetch(commodity):
+        price = commodity_price(commodity)
+        if sink is None:
+            prices[commodity] = price
+        else:
+            timestamp = time.time()
+            sink.add('commodity', commodity, price, timestamp)
+            if price_board is not None:
+                price_board.write_many('commodity', {commodity: price}, timestamp)
 
-    shared_commodity_dict = {}
     still_alive = []
 
     #Starts a new thread for each item in the list
     for commodity in commodities_list:
-        t = Thread(target=commodity_price, args=(commodity,))
+        t = Thread(target=fetch, args=(commodity,))
         t.start()
         still_alive.append(t)
 
@@ -309,7 +677,400 @@ def multiple_commodity_prices(commodities_list: list) -> dict:
         [still_alive.remove(item) for item in removal]
         time.sleep(.01)
 
-    return shared_commodity_dict
+    if sink is not None:
+        return sink
+
+    if price_board is not None:
+        price_board.write_many('commodity', prices)
+
+    return prices
+
+
+
+#############################################################
+
+
+
+
+
+###################### Streaming ############################
+
+
+def _eastern_offset(utc: datetime) -> timedelta:
+    '''
+    How far US Eastern time is behind UTC at the given naive UTC time, accounting for daylight saving time
+
+    :function:: _eastern_offset(utc: datetime) -> timedelta
+    '''
+    #Daylight saving time runs from 2am on the second sunday of march,
+    # to 2am on the first sunday of november
+    march = datetime(utc.year, 3, 8)
+    dst_start = march + timedelta(days=(6 - march.weekday()) % 7, hours=7)
+    november = datetime(utc.year, 11, 1)
+    dst_end = november + timedelta(days=(6 - november.weekday()) % 7, hours=6)
+
+    if dst_start <= utc < dst_end:
+        return timedelta(hours=4)
+    return timedelta(hours=5)
+
+
+def _us_eastern_time() -> datetime:
+    '''
+    Converts the current UTC time to US Eastern time, accounting for daylight saving time
+
+    :function:: _us_eastern_time() -> datetime
+
+    Returns:
+        datetime: A naive datetime of the current time in New York
+    '''
+    utc = datetime.now(timezone.utc).replace(tzinfo=None)
+    return utc - _eastern_offset(utc)
+
+
+def market_is_open(market: str) -> bool:
+    '''
+    Checks whether the provided market is currently trading, exchange holidays are not accounted for
+
+    :function:: market_is_open(market: str) -> bool
+
+    Args:
+        market (str):
+            Either 'stock', 'crypto', or 'commodity'
+
+    Returns:
+        bool:
+            True during US equity hours (9:30am - 4pm ET on weekdays) for stocks,
+            futures hours (6pm sunday - 5pm friday ET, with a daily 5pm - 6pm break) for commodities,
+            and always for cryptocurrencies
+
+    '''
+    if market == 'crypto':
+        return True
+
+    return _is_open_at(market, _us_eastern_time())
+
+
+def _is_open_at(market: str, eastern: datetime) -> bool:
+    '''
+    Checks whether a stock or commodity market trades at the given US Eastern time
+
+    :function:: _is_open_at(market: str, eastern: datetime) -> bool
+    '''
+    minutes = eastern.hour * 60 + eastern.minute
+    weekday = eastern.weekday()
+
+    if market == 'stock':
+        return weekday < 5 and 9 * 60 + 30 <= minutes < 16 * 60
+
+    if market == 'commodity':
+        if weekday == 5:
+            return False
+        if weekday == 6:
+            return minutes >= 18 * 60
+        if weekday == 4:
+            return minutes < 17 * 60
+        return not 17 * 60 <= minutes < 18 * 60
+
+    raise ValueError("market must be either 'stock', 'crypto', or 'commodity'")
+
+
+#The time of day, in US Eastern time, each market opens at after being closed
+_opening_times = {'stock': (9, 30), 'commodity': (18, 0)}
+
+
+def _seconds_until_open(market: str) -> float:
+    '''
+    How long until the provided market next opens, exchange holidays are not accounted for
+
+    :function:: _seconds_until_open(market: str) -> float
+
+    Returns:
+        float: The seconds until it opens, 0 if it's already open
+    '''
+    if market_is_open(market):
+        return 0
+
+    utc = datetime.now(timezone.utc).replace(tzinfo=None)
+    now = utc - _eastern_offset(utc)
+    hour, minute = _opening_times[market]
+
+    #Every market reopens at its opening time on one of the next few days
+    for day in range(8):
+        opening = (now + timedelta(days=day)).replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if opening > now and _is_open_at(market, opening):
+            #Converts back through UTC, in case daylight saving time changes before it opens
+            opening_utc = opening + _eastern_offset(opening + _eastern_offset(utc))
+            return max(0, (opening_utc - utc).total_seconds())
+
+    raise ValueError("market must be either 'stock' or 'commodity'")
+
+
+def watch_prices(stocks=(), cryptos=(), commodities=(), min_interval=5, max_interval=300):
+    '''
+    Continuously polls the provided symbols, each on its own schedule, yielding only the
+    prices that have changed since they were last seen. A symbol is polled more often while its
+    price is moving, less often while it's idle, and not at all while its market is closed.
+
+    :function:: watch_prices(stocks=(), cryptos=(), commodities=(), min_interval=5, max_interval=300) -> generator
+
+    Args:
+        stocks (list, *optional):
+            Stock tickers to watch
+
+        cryptos (list, *optional):
+            Cryptocurrency names to watch
+
+        commodities (list, *optional):
+            Commodity names to watch
+
+        min_interval (float, *optional):
+            The shortest time in seconds between polls of a single symbol, default is 5
+
+        max_interval (float, *optional):
+            The longest time in seconds between polls of a single symbol, default is 300
+
+    Yields:
+        tuple:
+            The market ('stock', 'crypto', or 'commodity'), the symbol, and its new price
+
+    '''
+    fetchers = {'stock': multiple_stock_prices,
+                'crypto': multiple_crypto_prices,
+                'commodity': multiple_commodity_prices,
+               }
+
+    #Each symbol maps to [next poll time, current interval, last seen price]
+    schedule = {}
+    for market, names in (('stock', stocks), ('crypto', cryptos), ('commodity', commodities)):
+        for name in names:
+            schedule[(market, name)] = [0, min_interval, None]
+
+    while schedule:
+        now = time.monotonic()
+
+        for market, fetcher in fetchers.items():
+            due = [name for (kind, name), entry in schedule.items() if kind == market and entry[0] <= now]
+            if not due:
+                continue
+
+            #Pushes closed markets back to when they next open, without spending a request on them
+            if not market_is_open(market):
+                opens = now + _seconds_until_open(market)
+                for name in due:
+                    schedule[(market, name)][0] = opens
+                continue
+
+            prices = fetcher(due)
+
+            for name in due:
+                entry = schedule[(market, name)]
+                price = prices.get(name)
+
+                #Halves the interval when the price moves, and doubles it when it doesn't,
+                # failed fetches back off the same way as idle symbols
+                if price is not None and price != entry[2]:
+                    entry[1] = max(min_interval, entry[1] / 2)
+                    entry[2] = price
+                    yield market, name, price
+                else:
+                    entry[1] = min(max_interval, entry[1] * 2)
+
+                entry[0] = time.monotonic() + entry[1]
+
+        #Sleeps until the next symbol is due
+        next_poll = min(entry[0] for entry in schedule.values())
+        time.sleep(max(0, next_poll - time.monotonic()))
+
+
+
+#############################################################
+
+
+
+
+
+####################### Price Board #########################
+
+
+def use_price_board(name='liveinvestmentdata', slots=4096) -> object:
+    '''
+    Publishes every price fetched by the multiple_*_prices functions to a shared-memory board,
+    which other local processes can read from with 'PriceBoard(name).read(market, name)'
+
+    :function:: use_price_board(name='liveinvestmentdata', slots=4096) -> object
+
+    Args:
+        name (str, *optional):
+            The name of the board, created if it doesn't exist yet. Passing None stops publishing.
+            Several processes can publish to the same board, their writes take turns. The board
+            stays up after every publisher exits, until something calls 'PriceBoard(name).unlink()'
+
+        slots (int, *optional):
+            How many symbols the board can hold, only used when creating it
+
+    Returns:
+        object: The PriceBoard being published to
+
+    '''
+    global price_board
+
+    if price_board is not None:
+        price_board.close()
+        price_board = None
+
+    if name is not None:
+        try:
+            price_board = PriceBoard(name, slots, create=True)
+        except FileExistsError:
+            price_board = PriceBoard(name)
+
+    return price_board
+
+
+
+#############################################################
+
+
+
+
+
+####################### Daemon Client #######################
+
+
+def _split_address(address: str) -> tuple:
+    '''
+    Splits a daemon address into a (host, port) pair, or a (socket path, None) pair
+    for unix sockets, which are any address containing a '/'
+
+    :function:: _split_address(address: str) -> tuple
+    '''
+    if '/' in address:
+        return address, None
+
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    '''
+    An HTTP connection over a unix socket, used to reach a daemon bound to a socket path
+    '''
+    def __init__(self, path: str, timeout=None):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        #Connects in blocking mode, a unix socket with a timeout fails straight away
+        # instead of waiting when the daemon's listen backlog is full
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+        self.sock.settimeout(self.timeout)
+
+
+def _daemon_request(path: str, address=None, timeout=None) -> object:
+    '''
+    Sends a GET request to the price daemon
+
+    :function:: _daemon_request(path: str, address=None, timeout=None) -> object
+
+    Returns:
+        object: The http.client response, still open for reading
+    '''
+    host, port = _split_address(address or price_daemon_address or DEFAULT_DAEMON_ADDRESS)
+    if port is None:
+        connection = _UnixHTTPConnection(host, timeout=timeout)
+    else:
+        connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    connection.request('GET', path)
+    return connection.getresponse()
+
+
+def use_price_daemon(address=DEFAULT_DAEMON_ADDRESS) -> None:
+    '''
+    Routes the stock, crypto, and commodity price functions through a local price daemon,
+    so every process on the machine shares one cache and one fetch stream
+
+    :function:: use_price_daemon(address=DEFAULT_DAEMON_ADDRESS) -> None
+
+    Args:
+        address (str, *optional):
+            Either 'host:port', or the path of a unix socket. Passing None goes back to
+            scraping directly. The LIVEINVESTMENTDATA_DAEMON environment variable sets this on import
+
+    '''
+    global price_daemon_address
+
+    price_daemon_address = address
+
+
+def daemon_price(market: str, name: str, address=None) -> float:
+    '''
+    Pulls a price from the local price daemon, which only scrapes it if its cached copy is stale
+
+    :function:: daemon_price(market: str, name: str, address=None) -> float
+
+    Args:
+        market (str):
+            Either 'stock', 'crypto', or 'commodity'
+
+        name (str):
+            The ticker or name of the investment
+
+        address (str, *optional):
+            The daemon address, defaults to the one set by 'use_price_daemon'
+
+    Returns:
+        float: The cached price
+
+    '''
+    response = _daemon_request(f'/price/{market}/{quote(name)}', address, timeout=60)
+    data = json.loads(response.read())
+
+    if response.status != 200:
+        raise ValueError(data['error'])
+
+    return data['price']
+
+
+def subscribe_prices(stocks=(), cryptos=(), commodities=(), address=None):
+    '''
+    Subscribes to the local price daemon, which pushes a price whenever it changes
+
+    :function:: subscribe_prices(stocks=(), cryptos=(), commodities=(), address=None) -> generator
+
+    Args:
+        stocks (list, *optional):
+            Stock tickers to subscribe to
+
+        cryptos (list, *optional):
+            Cryptocurrency names to subscribe to
+
+        commodities (list, *optional):
+            Commodity names to subscribe to
+
+        address (str, *optional):
+            The daemon address, defaults to the one set by 'use_price_daemon'
+
+    Yields:
+        tuple:
+            The market ('stock', 'crypto', or 'commodity'), the symbol, and its new price
+
+    '''
+    query = urlencode({'stock': ','.join(stocks),
+                       'crypto': ','.join(cryptos),
+                       'commodity': ','.join(commodities),
+                      })
+    response = _daemon_request(f'/subscribe?{query}', address)
+
+    try:
+        for line in response:
+            #Blank lines are keep-alives
+            if line.strip():
+                update = json.loads(line)
+                yield update['market'], update['name'], update['price']
+    finally:
+        response.close()
 
 
 
@@ -322,24 +1083,44 @@ def multiple_commodity_prices(commodities_list: list) -> dict:
 ######################### News #############################
 
 
+class _RowWriter:
+    '''
+    Stands in for the dictionary a news or statement function fills, appending each item
+    to a sink as it's parsed instead, keeping only the first of any repeated key
+    '''
+    def __init__(self, add, *columns):
+        self.add = add
+        self.columns = columns
+        self.seen = set()
+
+    def __setitem__(self, key, value):
+        if key not in self.seen:
+            self.seen.add(key)
+            self.add(*self.columns, key, value)
+
 
-def coinmarketcap_news(name: str) -> dict:
+def coinmarketcap_news(name: str, sink=None) -> dict:
     '''
     Pulls news from coinmarketcap.com for the provided cryptocurrency name
     
-    :function:: coinmarketcap_news(name: str) -> dict
+    :function:: coinmarketcap_news(name: str, sink=None) -> dict
 
     Args:
         name (str):
             The name of the cryptocurrency you want news for
 
+        sink (NewsSink, *optional):
+            Appends each story to the sink as soon as it's parsed, instead of collecting a dictionary
+
     Returns:
-        dict: The key is the news headline and the value is the link
+        dict: The key is the news headline and the value is the link, or the sink if one was passed
 
     '''
-    crypto_news = {}
+    crypto_news = {} if sink is None else _RowWriter(sink.add, name, 'coinmarketcap')
 
-    page = download_url(f"https://coinmarketcap.com/currencies/{name}")
+    slug = resolve_symbol('crypto', name)
+    page = download_url(f"https://coinmarketcap.com/currencies/{slug}",
+                        parse_only=SoupStrainer('div', class_='sc-101ku0o-2 exKUGw'))
 
     #Scrapes the page source for all new articles relating the said cryptp
     s = page.find('div', class_='sc-101ku0o-2 exKUGw')
@@ -347,26 +1128,31 @@ def coinmarketcap_news(name: str) -> dict:
     for news in loaded_news:
         crypto_news[news.text.strip()] = news.get('href')
 
-    return crypto_news
+    page.decompose()
+    return crypto_news if sink is None else sink
 
 
-def marketwatch_news(ticker: str) -> dict:
+def marketwatch_news(ticker: str, sink=None) -> dict:
     '''
     Pulls news from marketwatch.com for the provided stock ticker
 
-    :function:: marketwatch_news(ticker: str) -> dict
+    :function:: marketwatch_news(ticker: str, sink=None) -> dict
 
     Args:
         ticker (str):
             The ticker of the stock you want news for
 
+        sink (NewsSink, *optional):
+            Appends each story to the sink as soon as it's parsed, instead of collecting a dictionary
+
     Returns:
-        dict: The key is the news headline and the value is the link
+        dict: The key is the news headline and the value is the link, or the sink if one was passed
 
     '''
-    stock_news = {}
+    stock_news = {} if sink is None else _RowWriter(sink.add, ticker, 'marketwatch')
 
-    page = download_url(f"https://www.marketwatch.com/investing/stock/{ticker}")
+    page = download_url(f"https://www.marketwatch.com/investing/stock/{ticker}",
+                        parse_only=SoupStrainer('div', class_='collection__elements'))
 
     s = page.find('div', class_='collection__elements')
     loaded_news = s.find_all('h3')
@@ -378,28 +1164,33 @@ def marketwatch_news(ticker: str) -> dict:
         except AttributeError:
             pass
 
-    return stock_news
+    page.decompose()
+    return stock_news if sink is None else sink
 
 
-def businessinsider_news(commodity: str) -> dict:
+def businessinsider_news(commodity: str, sink=None) -> dict:
     '''
     Pulls news from markets.businessinsider.com for the provided commodity name
 
-    :function:: businessinsider_news(commodity: str) -> dict
+    :function:: businessinsider_news(commodity: str, sink=None) -> dict
 
     Args:
         name (str):
             The name of the commodity you want news for
 
+        sink (NewsSink, *optional):
+            Appends each story to the sink as soon as it's parsed, instead of collecting a dictionary
+
     Returns:
-        dict: The key is the news headline and the value is the link
+        dict: The key is the news headline and the value is the link, or the sink if one was passed
 
     '''
 
-    url = f"https://markets.businessinsider.com/commodities/{commodity}-price"
-    page = download_url(url)
+    slug = resolve_symbol('commodity', commodity)
+    url = f"https://markets.businessinsider.com/commodities/{slug}-price"
+    page = download_url(url, parse_only=SoupStrainer('section', class_="instrument-stories"))
 
-    news_stories = {}
+    news_stories = {} if sink is None else _RowWriter(sink.add, commodity, 'businessinsider')
 
     s = page.find('section', class_="instrument-stories")
     for news in s.find_all('h3'):
@@ -407,24 +1198,32 @@ def businessinsider_news(commodity: str) -> dict:
         link = news.find('a').get('href')
         news_stories[headline] = link
 
-    return news_stories
+    page.decompose()
+    return news_stories if sink is None else sink
 
 
 
-def stock_news(ticker: str) -> dict:
+def stock_news(ticker: str, sink=None) -> dict:
     '''
     Pulls news for a stock from multiple sources, and filters out repeats
     
-    :function:: stock_news(ticker: str) -> dict
+    :function:: stock_news(ticker: str, sink=None) -> dict
 
     Args:
         ticker (str):
             The ticker of the stock you want news for
 
+        sink (NewsSink, *optional):
+            Appends each story to the sink as soon as it's parsed, instead of collecting a dictionary
+
     Returns:
-        dict: The key is the news headline and the value is the link
+        dict: The key is the news headline and the value is the link, or the sink if one was passed
 
     '''
+    if sink is not None:
+        marketwatch_news(ticker, sink)
+        return sink
+
     stock_news_dict = {}
 
     stock_news_dict['marketwatch'] = marketwatch_news(ticker)
@@ -433,20 +1232,27 @@ def stock_news(ticker: str) -> dict:
     return stock_news_dict
 
 
-def crypto_news(name: str) -> dict:
+def crypto_news(name: str, sink=None) -> dict:
     '''
     Pulls news for a cryptocurrency from multiple sources, and filters out repeats
     
-    :function:: crypto_news(name: str) -> dict
+    :function:: crypto_news(name: str, sink=None) -> dict
 
     Args:
         name (str):
             The name of the cryptocurrency you want news for
 
+        sink (NewsSink, *optional):
+            Appends each story to the sink as soon as it's parsed, instead of collecting a dictionary
+
     Returns:
-        dict: The key is the news headline and the value is the link
+        dict: The key is the news headline and the value is the link, or the sink if one was passed
 
     '''
+    if sink is not None:
+        coinmarketcap_news(name, sink)
+        return sink
+
     crypto_news_dict = {}
 
     crypto_news_dict['coinmarketcap'] = coinmarketcap_news(name)
@@ -454,20 +1260,27 @@ def crypto_news(name: str) -> dict:
     return crypto_news_dict
 
 
-def commodity_news(name: str) -> dict:
+def commodity_news(name: str, sink=None) -> dict:
     '''
     Pulls news for a commodity from multiple sources, and filters out repeats
     
-    :function:: commodity_news(name: str) -> dict
+    :function:: commodity_news(name: str, sink=None) -> dict
 
     Args:
         name (str):
             The name of the commodity you want news for
 
+        sink (NewsSink, *optional):
+            Appends each story to the sink as soon as it's parsed, instead of collecting a dictionary
+
     Returns:
-        dict: The key is the news headline and the value is the link
+        dict: The key is the news headline and the value is the link, or the sink if one was passed
 
     '''
+    if sink is not None:
+        businessinsider_news(name, sink)
+        return sink
+
     commodity_news_dict = {}
 
     commodity_news_dict['businessinsider'] = businessinsider_news(name)
@@ -487,11 +1300,59 @@ def commodity_news(name: str) -> dict:
 ####################### Financials ##########################
 
 
-def marketwatch_income_statement(ticker: str, key_data_only=False, time_period='quarter') -> dict:
+def _marketwatch_statement(url: str, key_data_only: bool, data=None) -> dict:
+    '''
+    Pulls a financial statement table from marketwatch.com, parsing only the table bodies and
+    pairing each metric title with its values as the rows are read
+
+    :function:: _marketwatch_statement(url: str, key_data_only: bool, data=None) -> dict
+
+    Args:
+        data (dict, *optional):
+            What each metric is set on as it's read, a new dictionary by default
+
+    Returns:
+        dict:
+            The key is the financial metric title, and the value is a list of financial
+            data
+    '''
+    page = download_url(url, parse_only=SoupStrainer('div', class_='element__body'))
+
+    if key_data_only:
+        rows = page.find_all('tr', class_="is-highlighted")
+    else:
+        rows = page.find_all('tr', class_="table__row")
+
+    if data is None:
+        data = {}
+    title = None
+
+    #Each row's text splits into a metric title, followed by a list of its values
+    for row in rows:
+        for cell in row.text.split('\n\n'):
+            values = cell.split('\n')
+            if '' in values:
+                values.remove('')
+            if ' ' in values:
+                values.remove(' ')
+            if not values:
+                continue
+
+            if title is None:
+                title = values[0]
+            else:
+                data[title] = values
+                title = None
+
+    page.decompose()
+    return data
+
+
+def marketwatch_income_statement(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict:
     '''
     Pulls the income statement table from marketwatch.com for a stock
 
-    :function:: marketwatch_income_statement(ticker: str, key_data_only=False, time_period='quarter') -> dict
+    :function:: marketwatch_income_statement(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict
 
     Args:
         ticker (str):
@@ -501,57 +1362,34 @@ def marketwatch_income_statement(ticker: str, key_data_only=False, time_period='
             Only pulls key data from the income statement, which marketwatch highlights
 
         time_period (str, *optional):
-            Can either pull the data from the 'quarter' or 'annual' table, default is set to 'quarter'             
+            Can either pull the data from the 'quarter' or 'annual' table, default is set to 'quarter'
+
+        sink (StatementSink, *optional):
+            Appends each metric to the sink as soon as it's parsed, instead of collecting a dictionary
 
     Returns:
         dict: 
             The key is the financial metric title, and the value is a list of financial
-            data
+            data, or the sink if one was passed
 
     '''
     if time_period == 'annual':
-        page = download_url(f'https://www.marketwatch.com/investing/stock/{ticker}/financials/income')
+        url = f'https://www.marketwatch.com/investing/stock/{ticker}/financials/income'
     if time_period == 'quarter':
-        page = download_url(f'https://www.marketwatch.com/investing/stock/{ticker}/financials/income/quarter')
-    
-    vals = []
+        url = f'https://www.marketwatch.com/investing/stock/{ticker}/financials/income/quarter'
 
-    s = page.find_all('div', class_='element__body')
-    for x in s:
-        if key_data_only:
-            row = x.find_all('tr', class_="is-highlighted")
-        else:
-            row = x.find_all('tr', class_="table__row")
-        for x in row:
-            y = x.text.split('\n\n')
-            for i in y:
-                a = i.split('\n')
-                if '' in a:
-                    a.remove('')
-                if ' ' in a:
-                    a.remove(' ')
-                if a:
-                    vals.append(a)
-
-    data = {}
-
-    for x in range(len(vals)):
-        if x % 2 == 0:
-            data[vals[x][0]] = vals[x+1]
-
-    #Checks whether to pass new to thread operation, or just to return the value
-    try:
-        financial_data['Income Statement'] = data
-    except:
-        return data
+    data = None if sink is None else _RowWriter(sink.add, ticker, 'Income Statement', time_period)
+    data = _marketwatch_statement(url, key_data_only, data)
+
+    return data if sink is None else sink
 
 
 
-def marketwatch_balance_sheet(ticker: str, key_data_only=False, time_period='quarter') -> dict:
+def marketwatch_balance_sheet(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict:
     '''
     Pulls the balance sheet table from marketwatch.com for a stock
 
-    :function:: marketwatch_balance_sheet(ticker: str, key_data_only=False, time_period='quarter') -> dict
+    :function:: marketwatch_balance_sheet(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict
 
     Args:
         ticker (str):
@@ -563,55 +1401,31 @@ def marketwatch_balance_sheet(ticker: str, key_data_only=False, time_period='qua
         time_period (str, *optional):
             Can either pull the data from the 'quarter' or 'annual' table, default is set to 'quarter'
 
+        sink (StatementSink, *optional):
+            Appends each metric to the sink as soon as it's parsed, instead of collecting a dictionary
+
     Returns:
         dict: 
             The key is the financial metric title, and the value is a list of financial
-            data
+            data, or the sink if one was passed
 
     '''
     if time_period == 'annual':
-        page = download_url(f'https://www.marketwatch.com/investing/stock/{ticker}/financials/balance-sheet')
+        url = f'https://www.marketwatch.com/investing/stock/{ticker}/financials/balance-sheet'
     if time_period == 'quarter':
-        page = download_url(f'https://www.marketwatch.com/investing/stock/{ticker}/financials/balance-sheet/quarter')
+        url = f'https://www.marketwatch.com/investing/stock/{ticker}/financials/balance-sheet/quarter'
 
+    data = None if sink is None else _RowWriter(sink.add, ticker, 'Balance Sheet', time_period)
+    data = _marketwatch_statement(url, key_data_only, data)
 
-    vals = []
-
-    s = page.find_all('div', class_='element__body')
-    for x in s:
-        if key_data_only:
-            row = x.find_all('tr', class_="is-highlighted")
-        else:
-            row = x.find_all('tr', class_="table__row")
-        for x in row:
-            y = x.text.split('\n\n')
-            for i in y:
-                a = i.split('\n')
-                if '' in a:
-                    a.remove('')
-                if ' ' in a:
-                    a.remove(' ')
-                if a:
-                    vals.append(a)
-
-    data = {}
-
-    for x in range(len(vals)):
-        if x % 2 == 0:
-            data[vals[x][0]] = vals[x+1]
-
-    #Checks whether to pass new to thread operation, or just to return the value
-    try:
-        financial_data['Balance Sheet'] = data
-    except:
-        return data
+    return data if sink is None else sink
 
 
-def marketwatch_cash_flow(ticker: str, key_data_only=False, time_period='quarter') -> dict:
+def marketwatch_cash_flow(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict:
     '''
     Pulls the cash flow table from marketwatch.com for a stock
 
-    :function:: marketwatch_cash_flow(ticker: str, key_data_only=False, time_period='quarter') -> dict
+    :function:: marketwatch_cash_flow(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict
 
     Args:
         ticker (str):
@@ -623,55 +1437,31 @@ def marketwatch_cash_flow(ticker: str, key_data_only=False, time_period='quarter
         time_period (str, *optional):
             Can either pull the data from the 'quarter' or 'annual' table, default is set to 'quarter'
 
+        sink (StatementSink, *optional):
+            Appends each metric to the sink as soon as it's parsed, instead of collecting a dictionary
+
     Returns:
         dict: 
             The key is the financial metric title, and the value is a list of financial
-            data
+            data, or the sink if one was passed
 
     '''
     if time_period == 'annual':
-        page = download_url(f'https://www.marketwatch.com/investing/stock/{ticker}/financials/cash-flow')
+        url = f'https://www.marketwatch.com/investing/stock/{ticker}/financials/cash-flow'
     if time_period == 'quarter':
-        page = download_url(f'https://www.marketwatch.com/investing/stock/{ticker}/financials/cash-flow/quarter')
-
+        url = f'https://www.marketwatch.com/investing/stock/{ticker}/financials/cash-flow/quarter'
 
-    vals = []
+    data = None if sink is None else _RowWriter(sink.add, ticker, 'Cash Flow', time_period)
+    data = _marketwatch_statement(url, key_data_only, data)
 
-    s = page.find_all('div', class_='element__body')
-    for x in s:
-        if key_data_only:
-            row = x.find_all('tr', class_="is-highlighted")
-        else:
-            row = x.find_all('tr', class_="table__row")
-        for x in row:
-            y = x.text.split('\n\n')
-            for i in y:
-                a = i.split('\n')
-                if '' in a:
-                    a.remove('')
-                if ' ' in a:
-                    a.remove(' ')
-                if a:
-                    vals.append(a)
-
-    data = {}
-
-    for x in range(len(vals)):
-        if x % 2 == 0:
-            data[vals[x][0]] = vals[x+1]
-
-    #Checks whether to pass new to thread operation, or just to return the value
-    try:
-        financial_data['Cash Flow'] = data
-    except:
-        return data
+    return data if sink is None else sink
 
 
-def stock_financial_data(ticker: str, key_data_only=False, time_period='quarter') -> dict:
+def stock_financial_data(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict:
     '''
     Pulls the Income Statement, Balance Sheet, and Cash Flow tables from marketwatch.com for a stock
 
-    :function:: stock_financial_data(ticker: str, key_data_only=False, time_period='quarter') -> dict
+    :function:: stock_financial_data(ticker: str, key_data_only=False, time_period='quarter', sink=None) -> dict
 
     Args:
         ticker (str):
@@ -683,24 +1473,32 @@ def stock_financial_data(ticker: str, key_data_only=False, time_period='quarter'
         time_period (str, *optional):
             Can either pull the data from the 'quarter' or 'annual' table, default is set to 'quarter'
 
+        sink (StatementSink, *optional):
+            Appends each metric to the sink as soon as it's parsed, instead of collecting a dictionary
+
     Returns:
         dict: 
-            The key is the table type, and the value is dictionaries of the return value from the function above
+            The key is the table type, and the value is dictionaries of the return value from the function above,
+            or the sink if one was passed
 
     '''
-    global financial_data
-
-    documents = [marketwatch_income_statement, marketwatch_balance_sheet, marketwatch_cash_flow]
+    documents = {'Income Statement': marketwatch_income_statement,
+                 'Balance Sheet': marketwatch_balance_sheet,
+                 'Cash Flow': marketwatch_cash_flow,
+                }
 
     financial_data = {'Income Statement':None,
                       'Balance Sheet':None,
                       'Cash Flow':None,
                      }
 
+    def fetch(title, document):
+        financial_data[title] = document(ticker, key_data_only, time_period, sink)
+
     still_alive = []
 
-    for document in documents:
-        t = Thread(target=document, args=(ticker, key_data_only, time_period))
+    for title, document in documents.items():
+        t = Thread(target=fetch, args=(title, document))
         t.start()
         still_alive.append(t)
 
@@ -709,5 +1507,7 @@ def stock_financial_data(ticker: str, key_data_only=False, time_period='quarter'
         [still_alive.remove(item) for item in removal]
         time.sleep(.01)
 
+    if sink is not None:
+        return sink
 
     return financial_data
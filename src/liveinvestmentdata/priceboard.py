@@ -0,0 +1,350 @@
+'''
+
+Shared-memory price board, a fixed-layout table of price slots that any number of local
+processes can read without locks or IPC. Each slot is guarded by a seqlock, readers simply
+retry if they catch a slot mid-write.
+
+Layout:
+    header (64 bytes):
+        magic b'LIDB', layout version (u32), slot count (u32)
+
+    slot (64 bytes each):
+        sequence (u64), key (32 bytes), price (f64), timestamp (f64)
+
+    Keys are 'market:name' in utf-8. Keys longer than 32 bytes are stored as the byte 0xff,
+    an 8 byte blake2b digest of the whole key, and its first 23 bytes.
+
+    Slots are found by open addressing on the crc32 of the key, so every process agrees on
+    where a symbol lives. Writers in different processes take turns through an flock on a
+    lock file next to the board, on platforms without fcntl only one process should write.
+
+Lifetime:
+    A board outlives the process that created it, and every process that attached to it,
+    so publishers and readers can come and go. It lasts until one process calls 'unlink()',
+    normally whatever starts and stops the deployment, or until the machine restarts.
+
+Classes:
+    PriceBoard(name='liveinvestmentdata', slots=4096, create=False)
+        Attaches to, or creates, a shared-memory price board
+
+'''
+
+
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from threading import Lock
+import hashlib
+import os
+import struct
+import tempfile
+import time
+import warnings
+import zlib
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+MAGIC = b'LIDB'
+VERSION = 2
+
+_header = struct.Struct('<4sII56x')
+_slot = struct.Struct('<Q32sdd8x')
+_sequence = struct.Struct('<Q')
+_key = struct.Struct('<32s')
+_values = struct.Struct('<dd')
+
+KEY_SIZE = 32
+
+#Marks a key too long to store whole, which is identified by its digest instead
+_HASHED_KEY = 0xff
+_DIGEST_SIZE = 8
+
+#How many times a reader retries a slot that's mid-write, before treating it as unreadable
+max_read_spins = 100_000
+
+
+class PriceBoard:
+    '''
+    Attaches to, or creates, a shared-memory price board
+
+    Args:
+        name (str, *optional):
+            The name of the shared memory block, every process using the same name shares a board
+
+        slots (int, *optional):
+            How many symbols the board can hold, only used when creating it
+
+        create (bool, *optional):
+            Creates the board instead of attaching to an existing one
+
+    '''
+    def __init__(self, name='liveinvestmentdata', slots=4096, create=False):
+        if create:
+            self.memory = _create(name, _header.size + slots * _slot.size)
+            _header.pack_into(self.memory.buf, 0, MAGIC, VERSION, slots)
+        else:
+            self.memory = _attach(name)
+            magic, version, slots = _header.unpack_from(self.memory.buf, 0)
+            if magic != MAGIC or version != VERSION:
+                self.memory.close()
+                raise ValueError(f"Shared memory '{name}' isn't a version {VERSION} price board")
+
+        self.name = name
+        self.slots = slots
+        self.created = create
+        self._write_lock = Lock()
+        self._lock_file = None
+
+    def _offset(self, index: int) -> int:
+        return _header.size + index * _slot.size
+
+    def _find(self, key: bytes) -> tuple:
+        '''
+        Probes for the slot holding the key
+
+        :function:: _find(key: bytes) -> tuple
+
+        Returns:
+            tuple: The slot's offset, and whether it holds the key (False means it's the first free slot)
+        '''
+        buf = self.memory.buf
+        start = zlib.crc32(key) % self.slots
+
+        for probe in range(self.slots):
+            offset = self._offset((start + probe) % self.slots)
+            stored = _key.unpack_from(buf, offset + _sequence.size)[0]
+            if stored == key:
+                return offset, True
+            if stored[0] == 0:
+                return offset, False
+
+        return None, False
+
+    def write(self, market: str, name: str, price: float, timestamp=None) -> None:
+        '''
+        Publishes a price to the board
+
+        :function:: write(market: str, name: str, price: float, timestamp=None) -> None
+
+        Args:
+            market (str):
+                Either 'stock', 'crypto', or 'commodity'
+
+            name (str):
+                The ticker or name of the investment
+
+            price (float):
+                The price to publish
+
+            timestamp (float, *optional):
+                When the price was fetched, as seconds since the epoch, defaults to now
+
+        '''
+        if timestamp is None:
+            timestamp = time.time()
+
+        with self._writing():
+            self._write(_encode_key(market, name), price, timestamp)
+
+    @contextmanager
+    def _writing(self):
+        '''
+        Holds the write lock, both between threads and between processes
+        '''
+        with self._write_lock:
+            if fcntl is None:
+                yield
+                return
+
+            if self._lock_file is None:
+                lock_name = self.name.strip('/') + '.priceboard.lock'
+                self._lock_file = open(os.path.join(tempfile.gettempdir(), lock_name), 'a')
+
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _write(self, key: bytes, price: float, timestamp: float) -> None:
+        buf = self.memory.buf
+
+        offset, found = self._find(key)
+        if offset is None:
+            raise MemoryError(f'Price board is full, all {self.slots} slots are taken')
+
+        #An odd sequence tells readers the slot is mid-write. Finding one already odd means
+        # a writer died mid-write, so it's bumped to a new odd number before rewriting the slot
+        sequence = _sequence.unpack_from(buf, offset)[0]
+        sequence += 1 if sequence % 2 == 0 else 2
+        _sequence.pack_into(buf, offset, sequence)
+        if not found:
+            _key.pack_into(buf, offset + _sequence.size, key)
+        _values.pack_into(buf, offset + _sequence.size + KEY_SIZE, price, timestamp)
+        _sequence.pack_into(buf, offset, sequence + 1)
+
+    def write_many(self, market: str, prices: dict, timestamp=None) -> list:
+        '''
+        Publishes a dictionary of prices, as returned by the multiple_*_prices functions.
+        Prices that don't fit on a full board are skipped with a warning, rather than raising
+
+        :function:: write_many(market: str, prices: dict, timestamp=None) -> list
+
+        Returns:
+            list: The names that couldn't be published
+        '''
+        if timestamp is None:
+            timestamp = time.time()
+
+        skipped = []
+        with self._writing():
+            for name, price in prices.items():
+                try:
+                    self._write(_encode_key(market, name), price, timestamp)
+                except MemoryError:
+                    skipped.append(name)
+
+        if skipped:
+            warnings.warn(f'Price board {self.name} is full, {len(skipped)} {market} prices were not published')
+
+        return skipped
+
+    def read(self, market: str, name: str) -> tuple:
+        '''
+        Reads the latest price from the board without taking any locks
+
+        :function:: read(market: str, name: str) -> tuple
+
+        Args:
+            market (str):
+                Either 'stock', 'crypto', or 'commodity'
+
+            name (str):
+                The ticker or name of the investment
+
+        Returns:
+            tuple:
+                The price and the time it was fetched, or None if the board doesn't hold the symbol,
+                or its slot was left mid-write by a writer that died
+
+        '''
+        offset, found = self._find(_encode_key(market, name))
+        if not found:
+            return None
+
+        slot = self._read_slot(offset)
+        return slot[1:] if slot else None
+
+    def _read_slot(self, offset: int) -> tuple:
+        buf = self.memory.buf
+
+        #Retries until the sequence is even, and unchanged across the read
+        for _ in range(max_read_spins):
+            before = _sequence.unpack_from(buf, offset)[0]
+            if before % 2:
+                continue
+            _, key, price, timestamp = _slot.unpack_from(buf, offset)
+            if _sequence.unpack_from(buf, offset)[0] == before:
+                return key, price, timestamp
+
+        return None
+
+    def items(self) -> dict:
+        '''
+        Reads every price on the board
+
+        :function:: items() -> dict
+
+        Returns:
+            dict:
+                The key is a (market, name) pair, and the value is a (price, timestamp) pair.
+                Names too long to store whole are cut short and end with '...'
+        '''
+        prices = {}
+        for index in range(self.slots):
+            offset = self._offset(index)
+            if self.memory.buf[offset + _sequence.size] == 0:
+                continue
+            slot = self._read_slot(offset)
+            if slot is None:
+                continue
+            key, price, timestamp = slot
+            market, _, name = _decode_key(key).partition(':')
+            prices[(market, name)] = (price, timestamp)
+
+        return prices
+
+    def close(self) -> None:
+        '''
+        Detaches this process from the board
+        '''
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+        self.memory.close()
+
+    def unlink(self) -> None:
+        '''
+        Destroys the board, once every process has closed it. Nothing does this automatically,
+        so call it once from whichever process owns the deployment when the board is no longer needed
+        '''
+        #Python before 3.13 always tells the resource tracker the memory is gone when unlinking,
+        # so it's registered again first rather than leaving the tracker to complain
+        if getattr(self.memory, '_track', True):
+            resource_tracker.register(self.memory._name, 'shared_memory')
+        self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _encode_key(market: str, name: str) -> bytes:
+    key = f'{market}:{name}'.encode()
+    if len(key) <= KEY_SIZE:
+        return key.ljust(KEY_SIZE, b'\0')
+
+    digest = hashlib.blake2b(key, digest_size=_DIGEST_SIZE).digest()
+    return bytes([_HASHED_KEY]) + digest + key[:KEY_SIZE - 1 - _DIGEST_SIZE]
+
+
+def _decode_key(key: bytes) -> str:
+    if key[0] == _HASHED_KEY:
+        return key[1 + _DIGEST_SIZE:].decode(errors='ignore') + '...'
+
+    return key.rstrip(b'\0').decode()
+
+
+def _create(name: str, size: int) -> object:
+    '''
+    Creates shared memory without letting this process's resource tracker destroy it on exit,
+    so the board stays up for the other processes using it after its creator is gone
+
+    :function:: _create(name: str, size: int) -> object
+    '''
+    try:
+        return shared_memory.SharedMemory(name, create=True, size=size, track=False)
+    except TypeError:
+        memory = shared_memory.SharedMemory(name, create=True, size=size)
+        resource_tracker.unregister(memory._name, 'shared_memory')
+        return memory
+
+
+def _attach(name: str) -> object:
+    '''
+    Attaches to existing shared memory without letting this process's resource tracker
+    destroy it on exit, which it otherwise does on python versions before 3.13
+
+    :function:: _attach(name: str) -> object
+    '''
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        memory = shared_memory.SharedMemory(name)
+        resource_tracker.unregister(memory._name, 'shared_memory')
+        return memory
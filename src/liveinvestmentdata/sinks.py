@@ -0,0 +1,269 @@
+'''
+
+Export sinks, which buffer results column by column and write them out as Apache Arrow
+record batches, to Parquet or CSV files, or kept in memory. Rows are appended in chunks of
+'batch_size', so large batches stream to disk with a bounded buffer.
+
+Requires pyarrow, installed with 'pip install liveinvestmentdata[arrow]'
+
+Schemas:
+    QUOTE_SCHEMA
+        market, symbol, price (float64), time (UTC timestamp)
+
+    NEWS_SCHEMA
+        symbol, source, headline, url
+
+    STATEMENT_SCHEMA
+        symbol, statement, time_period, metric, period (int16, 0 is the oldest column),
+        value (as marketwatch shows it), amount (float64 parsed from value, e.g '(46.45B)' is -46.45e9)
+
+Classes:
+    QuoteSink(path=None, format='parquet', batch_size=10000)
+        Collects prices, can be passed to the multiple_*_prices functions as their sink
+
+    NewsSink(path=None, format='parquet', batch_size=10000)
+        Collects news stories, can be passed to the news functions as their sink
+
+    StatementSink(path=None, format='parquet', batch_size=10000)
+        Collects financial statement rows, one per metric and period, can be passed to the
+        financials functions as their sink
+
+'''
+
+
+from datetime import datetime, timezone
+from threading import Lock
+import time
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+if pa is not None:
+    QUOTE_SCHEMA = pa.schema([('market', pa.string()),
+                              ('symbol', pa.string()),
+                              ('price', pa.float64()),
+                              ('time', pa.timestamp('us', tz='UTC')),
+                             ])
+
+    NEWS_SCHEMA = pa.schema([('symbol', pa.string()),
+                             ('source', pa.string()),
+                             ('headline', pa.string()),
+                             ('url', pa.string()),
+                            ])
+
+    STATEMENT_SCHEMA = pa.schema([('symbol', pa.string()),
+                                  ('statement', pa.string()),
+                                  ('time_period', pa.string()),
+                                  ('metric', pa.string()),
+                                  ('period', pa.int16()),
+                                  ('value', pa.string()),
+                                  ('amount', pa.float64()),
+                                 ])
+else:
+    QUOTE_SCHEMA = NEWS_SCHEMA = STATEMENT_SCHEMA = None
+
+
+_multipliers = {'K': 1e3, 'M': 1e6, 'B': 1e9, 'T': 1e12}
+
+
+def parse_amount(value: str) -> float:
+    '''
+    Parses a financial value as marketwatch shows it into a number
+
+    :function:: parse_amount(value: str) -> float
+
+    Args:
+        value (str):
+            e.g '128.65B', '(46.45B)', '12.5%', or '-'
+
+    Returns:
+        float: The amount, negative for values in parentheses, or None if it isn't a number
+
+    '''
+    text = value.strip().replace(',', '').replace('$', '')
+
+    negative = text.startswith('(') and text.endswith(')')
+    text = text.strip('()').rstrip('%')
+
+    multiplier = 1
+    if text and text[-1].upper() in _multipliers:
+        multiplier = _multipliers[text[-1].upper()]
+        text = text[:-1]
+
+    try:
+        amount = float(text) * multiplier
+    except ValueError:
+        return None
+
+    return -amount if negative else amount
+
+
+class ArrowSink:
+    '''
+    Buffers rows by column, and turns every 'batch_size' rows into an Arrow record batch
+
+    Args:
+        path (str, *optional):
+            The file batches are written to, when None they're kept in 'batches' instead
+
+        format (str, *optional):
+            Either 'parquet' or 'csv', default is 'parquet'
+
+        batch_size (int, *optional):
+            How many rows are buffered before they're written as a record batch
+
+    '''
+    schema = None
+
+    def __init__(self, path=None, format='parquet', batch_size=10_000):
+        if pa is None:
+            raise ImportError("Export sinks require pyarrow, install it with 'pip install liveinvestmentdata[arrow]'")
+        if format not in ('parquet', 'csv'):
+            raise ValueError("format must be either 'parquet' or 'csv'")
+
+        self.path = path
+        self.format = format
+        self.batch_size = batch_size
+        self.batches = []
+
+        self._columns = [[] for _ in self.schema]
+        self._writer = None
+        self._lock = Lock()
+
+    def _append(self, *values) -> None:
+        with self._lock:
+            for column, value in zip(self._columns, values):
+                column.append(value)
+
+            if len(self._columns[0]) >= self.batch_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not self._columns[0]:
+            return
+
+        arrays = [pa.array(column, type=field.type) for column, field in zip(self._columns, self.schema)]
+        batch = pa.record_batch(arrays, schema=self.schema)
+        self._columns = [[] for _ in self.schema]
+
+        if self.path is None:
+            self.batches.append(batch)
+        else:
+            self._open_writer()
+            self._writer.write_batch(batch)
+
+    def _open_writer(self) -> None:
+        if self._writer is None:
+            if self.format == 'parquet':
+                self._writer = pq.ParquetWriter(self.path, self.schema)
+            else:
+                self._writer = pa_csv.CSVWriter(self.path, self.schema)
+
+    def flush(self) -> None:
+        '''
+        Writes any buffered rows as a record batch, even if there are fewer than 'batch_size'
+        '''
+        with self._lock:
+            self._flush()
+
+    def table(self) -> object:
+        '''
+        Returns every row collected so far as a pyarrow Table, only for sinks without a path
+
+        :function:: table() -> object
+        '''
+        if self.path is not None:
+            raise ValueError(f'Rows have been written to {self.path}, read them back from there')
+
+        self.flush()
+        return pa.Table.from_batches(self.batches, schema=self.schema)
+
+    def close(self) -> None:
+        '''
+        Writes any buffered rows, and closes the file, which is still created if no rows were added
+        '''
+        with self._lock:
+            self._flush()
+            if self.path is not None:
+                self._open_writer()
+                self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class QuoteSink(ArrowSink):
+    '''
+    Collects prices, which can be passed to the multiple_*_prices functions as their sink
+    so each price is appended as soon as it's scraped
+    '''
+    schema = QUOTE_SCHEMA
+
+    def add(self, market: str, symbol: str, price: float, timestamp=None) -> None:
+        '''
+        Appends a price, timestamp is seconds since the epoch and defaults to now
+        '''
+        if timestamp is None:
+            timestamp = time.time()
+
+        self._append(market, symbol, price, datetime.fromtimestamp(timestamp, timezone.utc))
+
+    def add_prices(self, market: str, prices: dict, timestamp=None) -> None:
+        '''
+        Appends a dictionary of prices, as returned by the multiple_*_prices functions
+        '''
+        for symbol, price in prices.items():
+            self.add(market, symbol, price, timestamp)
+
+
+class NewsSink(ArrowSink):
+    '''
+    Collects news stories, which can be passed to the news functions as their sink
+    so each story is appended as soon as it's parsed
+    '''
+    schema = NEWS_SCHEMA
+
+    def add(self, symbol: str, source: str, headline: str, url: str) -> None:
+        '''
+        Appends one news story
+        '''
+        self._append(symbol, source, headline, url)
+
+    def add_news(self, symbol: str, news: dict) -> None:
+        '''
+        Appends every story from a stock_news, crypto_news, or commodity_news result
+        '''
+        for source, stories in news.items():
+            for headline, url in stories.items():
+                self.add(symbol, source, headline, url)
+
+
+class StatementSink(ArrowSink):
+    '''
+    Collects financial statement rows, one per metric and period, which can be passed to the
+    financials functions as their sink so each metric is appended as soon as it's parsed
+    '''
+    schema = STATEMENT_SCHEMA
+
+    def add(self, symbol: str, statement: str, time_period: str, metric: str, values: list) -> None:
+        '''
+        Appends a metric's values, as returned by the marketwatch statement functions, a row per period
+        '''
+        for period, value in enumerate(values):
+            self._append(symbol, statement, time_period, metric, period, value, parse_amount(value))
+
+    def add_financials(self, symbol: str, financial_data: dict, time_period='quarter') -> None:
+        '''
+        Appends every table from a stock_financial_data result, skipping tables that couldn't be fetched
+        '''
+        for statement, metrics in financial_data.items():
+            for metric, values in (metrics or {}).items():
+                self.add(symbol, statement, time_period, metric, values)
@@ -0,0 +1,248 @@
+'''
+
+Record and replay transport, which every page download goes through. Recording writes each
+page to disk, gzipped and addressed by its sha256, along with its url and timing. Replaying
+serves those captures back instead of touching the network, either as fast as possible or
+paced so each response arrives when it did in the recording, so sessions can be reproduced
+and load tested offline.
+
+Session layout:
+    <directory>/session.ndjson
+        One {"url", "sha256", "status", "start", "elapsed"} line per request, in the order made,
+        where start is seconds since the session began and elapsed is how long the request took.
+        Recording into an existing session carries on from its last offset, so starts keep increasing
+
+    <directory>/objects/<first 2 hex digits>/<sha256>.gz
+        The page content, shared by every request that returned the same bytes
+
+Functions:
+    record_session(directory: str) -> None
+        Records every page downloaded from now on into the directory
+
+    replay_session(directory: str, speed=None) -> None
+        Serves every page download from a recorded session instead of the network
+
+    live_session() -> None
+        Goes back to downloading pages from the network without recording
+
+    fetch(url: str, timeout=None) -> bytes
+        Downloads a page through the current transport
+
+'''
+
+
+from collections import defaultdict, deque
+from threading import Lock
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import requests
+
+
+#Either 'live', 'record', or 'replay'
+mode = 'live'
+
+session_directory = None
+
+#Divides the recorded time of each request when replaying, None replays as fast as possible
+replay_speed = None
+
+#When recording, the time the session started, when replaying, url -> deque of recorded requests
+_session_started = None
+_recordings = {}
+
+#When replaying, the time of the first request, which recorded offsets are paced from
+_replay_started = None
+
+_lock = Lock()
+
+
+def _object_path(directory: str, digest: str) -> str:
+    return os.path.join(directory, 'objects', digest[:2], f'{digest}.gz')
+
+
+def record_session(directory: str) -> None:
+    '''
+    Records every page downloaded from now on into the directory, appending to any session already there
+
+    :function:: record_session(directory: str) -> None
+
+    Args:
+        directory (str):
+            Where the session is written, created if it doesn't exist
+
+    '''
+    global mode, session_directory, _session_started
+
+    os.makedirs(os.path.join(directory, 'objects'), exist_ok=True)
+
+    #Picks up where an existing session left off, so its offsets keep increasing
+    recorded = 0
+    try:
+        with open(os.path.join(directory, 'session.ndjson')) as file:
+            for line in file:
+                if line.strip():
+                    entry = json.loads(line)
+                    recorded = max(recorded, entry['start'] + entry['elapsed'])
+    except FileNotFoundError:
+        pass
+
+    with _lock:
+        mode = 'record'
+        session_directory = directory
+        _session_started = time.time() - recorded
+
+
+def replay_session(directory: str, speed=None) -> None:
+    '''
+    Serves every page download from a recorded session instead of the network. Each url is
+    answered with its recorded responses in order, cycling back to the first once they run out
+
+    :function:: replay_session(directory: str, speed=None) -> None
+
+    Args:
+        directory (str):
+            A directory written by 'record_session'
+
+        speed (float, *optional):
+            Paces each response to arrive when it did in the recording, measured from the first
+            request and divided by speed, so 1 is the recorded speed and 2 is twice as fast.
+            A request made later than it was recorded still waits its recorded time divided by speed.
+            None, the default, replays as fast as possible
+
+    '''
+    global mode, session_directory, replay_speed, _recordings, _replay_started
+
+    recordings = defaultdict(deque)
+    with open(os.path.join(directory, 'session.ndjson')) as file:
+        for line in file:
+            if line.strip():
+                entry = json.loads(line)
+                recordings[entry['url']].append(entry)
+
+    with _lock:
+        mode = 'replay'
+        session_directory = directory
+        replay_speed = speed
+        _recordings = dict(recordings)
+        _replay_started = None
+
+
+def live_session() -> None:
+    '''
+    Goes back to downloading pages from the network without recording
+
+    :function:: live_session() -> None
+    '''
+    global mode, session_directory, _recordings
+
+    with _lock:
+        mode = 'live'
+        session_directory = None
+        _recordings = {}
+
+
+def fetch(url: str, timeout=None) -> bytes:
+    '''
+    Downloads a page through the current transport
+
+    :function:: fetch(url: str, timeout=None) -> bytes
+
+    Args:
+        url (str):
+            The url of the page you want downloaded
+
+        timeout (float, *optional):
+            How long in seconds to wait on the site, ignored when replaying
+
+    Returns:
+        bytes: The page content
+
+    '''
+    if mode == 'replay':
+        return _replay(url)
+
+    started = time.time()
+    response = requests.get(url, timeout=timeout)
+    elapsed = time.time() - started
+
+    if mode == 'record':
+        _record(url, response, started, elapsed)
+
+    return response.content
+
+
+def _record(url: str, response: object, started: float, elapsed: float) -> None:
+    '''
+    Writes a page to the session's object store and appends its request to the session log
+
+    :function:: _record(url: str, response: object, started: float, elapsed: float) -> None
+    '''
+    with _lock:
+        directory, session_started = session_directory, _session_started
+
+    digest = hashlib.sha256(response.content).hexdigest()
+    path = _object_path(directory, digest)
+
+    #Identical pages are only stored once. Each writer gets its own temporary file, so threads
+    # recording the same page at once just replace the object with identical content
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as raw, gzip.open(raw, 'wb') as file:
+                file.write(response.content)
+            os.replace(temporary, path)
+        except OSError:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            if not os.path.exists(path):
+                raise
+
+    entry = {'url': url,
+             'sha256': digest,
+             'status': response.status_code,
+             'start': round(started - session_started, 6),
+             'elapsed': round(elapsed, 6),
+            }
+
+    with _lock:
+        with open(os.path.join(directory, 'session.ndjson'), 'a') as file:
+            file.write(json.dumps(entry) + '\n')
+
+
+def _replay(url: str) -> bytes:
+    '''
+    Serves the next recorded response for the url
+
+    :function:: _replay(url: str) -> bytes
+    '''
+    global _replay_started
+
+    requested = time.time()
+
+    with _lock:
+        directory, speed = session_directory, replay_speed
+        recorded = _recordings.get(url)
+        if not recorded:
+            raise LookupError(f'No recording of {url} in {directory}')
+        entry = recorded[0]
+        recorded.rotate(-1)
+        if _replay_started is None:
+            _replay_started = requested - entry['start'] / speed if speed else requested
+        started = _replay_started
+
+    with gzip.open(_object_path(directory, entry['sha256']), 'rb') as file:
+        content = file.read()
+
+    if speed:
+        #Answers when the recorded response arrived, or after its recorded latency if asked late
+        arrives = max(started + (entry['start'] + entry['elapsed']) / speed,
+                      requested + entry['elapsed'] / speed)
+        time.sleep(max(0, arrives - time.time()))
+
+    return content